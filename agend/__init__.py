@@ -6,11 +6,6 @@ A supervisor/worker agent pattern for iterative task completion.
 
 __version__ = "0.2.1"
 
-from agend.agent_cli import AgentCLI, CursorCLI, AgentType
-from agend.supervisor import SupervisorAgent
-from agend.worker import WorkerAgent
-from agend.task_runner import TaskRunner
-
 __all__ = [
     "AgentCLI",
     "CursorCLI",
@@ -19,3 +14,29 @@ __all__ = [
     "WorkerAgent",
     "TaskRunner",
 ]
+
+# Public names are resolved on first access so that `agend.cli` (which imports
+# this package) does not pay for loading the agent modules on every invocation.
+_LAZY_EXPORTS = {
+    "AgentCLI": "agend.agent_cli",
+    "CursorCLI": "agend.agent_cli",
+    "AgentType": "agend.agent_cli",
+    "SupervisorAgent": "agend.supervisor",
+    "WorkerAgent": "agend.worker",
+    "TaskRunner": "agend.task_runner",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,41 @@
+"""
+JSON helpers shared by the package.
+
+Uses orjson when it is installed (pip install agend[speedups]) and the
+standard library otherwise. Both backends produce the same output: UTF-8
+bytes with non-ASCII characters kept as-is, and non-string dict keys
+converted to strings.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install agend[speedups])
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so catching the
+# stdlib exception covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from a str or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Serialize data as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_compact(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON (no whitespace)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
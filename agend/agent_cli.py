@@ -4,13 +4,22 @@ AgentCLI - Base class and implementations for agent execution.
 Provides a unified interface for executing agent commands via CLI or API.
 """
 
+import asyncio
+import codecs
+import io
+import os
 import subprocess
-import json
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Union, Callable
 
+from agend import _json
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AgentType(str, Enum):
     """Supported agent types."""
@@ -19,9 +28,14 @@ class AgentType(str, Enum):
     # Future: Add more agent types like "openai-api", "anthropic-api", etc.
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResponse:
-    """Response from an agent execution."""
+    """
+    Response from an agent execution.
+
+    ``output`` is ``raw_output`` with surrounding whitespace stripped; when
+    there is nothing to strip both fields reference the same string.
+    """
 
     success: bool
     output: str
@@ -41,7 +55,7 @@ class AgentResponse:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return _json.dumps_indented(self.to_dict()).decode("utf-8")
 
 
 class AgentCLI(ABC):
@@ -101,6 +115,35 @@ class AgentCLI(ABC):
         """
         pass
 
+    async def aexecute(
+        self,
+        prompt: str,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> AgentResponse:
+        """
+        Execute the agent with the given prompt without blocking the event loop.
+
+        The default implementation runs execute() in a worker thread;
+        subclasses with a native asynchronous transport should override it.
+
+        Args:
+            prompt: The prompt/context to send to the agent.
+            on_output: Optional callback for real-time output streaming.
+
+        Returns:
+            AgentResponse containing the execution result.
+        """
+        return await asyncio.to_thread(self.execute, prompt, on_output)
+
+    def close(self) -> None:
+        """
+        Release any resources held by the agent CLI.
+
+        Called by TaskRunner when a run ends. The default implementation does
+        nothing; agents that keep processes or connections alive between
+        prompts should override it. Safe to call more than once.
+        """
+
     @classmethod
     def create(
         cls,
@@ -122,10 +165,10 @@ class AgentCLI(ABC):
         if isinstance(agent_type, str):
             agent_type = AgentType(agent_type)
 
-        if agent_type == AgentType.CURSOR_CLI:
-            return CursorCLI(model=model, **kwargs)
-        else:
+        agent_cls = _AGENT_REGISTRY.get(agent_type)
+        if agent_cls is None:
             raise ValueError(f"Unsupported agent type: {agent_type}")
+        return agent_cls(model=model, **kwargs)
 
 
 class CursorCLI(AgentCLI):
@@ -135,6 +178,9 @@ class CursorCLI(AgentCLI):
     Executes prompts using the cursor-cli command.
     """
 
+    # Size of each raw read from the agent's stdout pipe
+    READ_CHUNK_SIZE = 65536
+
     def __init__(
         self,
         model: str = "claude-4.5-opus-high-thinking",
@@ -155,6 +201,8 @@ class CursorCLI(AgentCLI):
         """
         super().__init__(model=model, timeout=timeout, working_dir=working_dir, chat_id=chat_id)
         self.cursor_command = cursor_command
+        # The cursor-cli process currently running a prompt, if any
+        self._process: Optional[Union[subprocess.Popen, asyncio.subprocess.Process]] = None
 
     def create_chat(self) -> str:
         """
@@ -186,6 +234,61 @@ class CursorCLI(AgentCLI):
                 "Please ensure cursor-cli is installed and in PATH."
             )
 
+    def _build_command(self, prompt: str) -> list[str]:
+        """Build the cursor-cli command line for a prompt."""
+        cmd = [self.cursor_command]
+
+        # Add --resume if we have a chat_id
+        if self.chat_id:
+            cmd.extend(["--resume", self.chat_id])
+
+        cmd.append(prompt)
+        return cmd
+
+    def _build_response(
+        self, return_code: Optional[int], output: str, stderr_output: Optional[bytes]
+    ) -> AgentResponse:
+        """Build the AgentResponse for a finished cursor-cli process."""
+        stderr_text = stderr_output.decode("utf-8", errors="replace") if stderr_output else None
+        error = stderr_text.strip() if stderr_text else None
+
+        return AgentResponse(
+            success=return_code == 0,
+            output=output.strip(),
+            raw_output=output,
+            error=error,
+            metadata={
+                "return_code": return_code,
+                "model": self.model,
+                "command": self.cursor_command,
+                "chat_id": self.chat_id,
+            },
+        )
+
+    def _error_response(self, exc: BaseException) -> AgentResponse:
+        """Build the AgentResponse for a process that could not finish."""
+        if isinstance(exc, (subprocess.TimeoutExpired, asyncio.TimeoutError)):
+            return AgentResponse(
+                success=False,
+                output="",
+                error=f"Command timed out after {self.timeout} seconds",
+                metadata={"timeout": self.timeout, "chat_id": self.chat_id},
+            )
+        if isinstance(exc, FileNotFoundError):
+            return AgentResponse(
+                success=False,
+                output="",
+                error=f"Command not found: {self.cursor_command}. "
+                "Please ensure cursor-cli is installed and in PATH.",
+                metadata={"command": self.cursor_command},
+            )
+        return AgentResponse(
+            success=False,
+            output="",
+            error=str(exc),
+            metadata={"exception_type": type(exc).__name__, "chat_id": self.chat_id},
+        )
+
     def execute(
         self,
         prompt: str,
@@ -202,81 +305,178 @@ class CursorCLI(AgentCLI):
         Returns:
             AgentResponse with the execution result.
         """
+        process = None
         try:
-            # Build the command
-            cmd = [self.cursor_command]
-
-            # Add --resume if we have a chat_id
-            if self.chat_id:
-                cmd.extend(["--resume", self.chat_id])
-
-            cmd.append(prompt)
-
             # Use Popen for real-time output streaming
             process = subprocess.Popen(
-                cmd,
+                self._build_command(prompt),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
                 cwd=self.working_dir,
-                bufsize=1,  # Line buffered
             )
+            self._process = process
 
-            output_lines = []
-
-            # Stream stdout in real-time
+            # Stream stdout in real-time, reading large chunks
+            stream = _LineStream(on_output)
             if process.stdout:
-                for line in iter(process.stdout.readline, ""):
-                    if line:
-                        output_lines.append(line)
-                        # Real-time output: use callback or print directly
-                        if on_output:
-                            on_output(line)
-                        else:
-                            print(line, end="", flush=True)
+                fd = process.stdout.fileno()
+                while True:
+                    chunk = os.read(fd, self.READ_CHUNK_SIZE)
+                    stream.feed(chunk)
+                    if not chunk:
+                        break
 
             # Wait for process to complete
             process.wait(timeout=self.timeout)
 
             # Collect stderr
             stderr_output = process.stderr.read() if process.stderr else None
-            error = stderr_output.strip() if stderr_output else None
 
-            output = "".join(output_lines)
+            return self._build_response(process.returncode, stream.getvalue(), stderr_output)
 
-            return AgentResponse(
-                success=process.returncode == 0,
-                output=output.strip(),
-                raw_output=output,
-                error=error,
-                metadata={
-                    "return_code": process.returncode,
-                    "model": self.model,
-                    "command": self.cursor_command,
-                    "chat_id": self.chat_id,
-                },
-            )
+        except Exception as e:
+            if isinstance(e, subprocess.TimeoutExpired) and process is not None:
+                process.kill()
+            return self._error_response(e)
+        finally:
+            self._process = None
 
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return AgentResponse(
-                success=False,
-                output="",
-                error=f"Command timed out after {self.timeout} seconds",
-                metadata={"timeout": self.timeout, "chat_id": self.chat_id},
-            )
-        except FileNotFoundError:
-            return AgentResponse(
-                success=False,
-                output="",
-                error=f"Command not found: {self.cursor_command}. "
-                "Please ensure cursor-cli is installed and in PATH.",
-                metadata={"command": self.cursor_command},
+    async def aexecute(
+        self,
+        prompt: str,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> AgentResponse:
+        """
+        Execute the prompt using an asyncio subprocess.
+
+        Behaves like execute(), but awaits the agent's output instead of
+        blocking, so the event loop can run other work meanwhile.
+
+        Args:
+            prompt: The prompt to send to the agent.
+            on_output: Optional callback for real-time output.
+                       If None, prints to stdout directly.
+
+        Returns:
+            AgentResponse with the execution result.
+        """
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._build_command(prompt),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.working_dir,
             )
+            self._process = process
+
+            async def drain() -> tuple[str, bytes]:
+                stream = _LineStream(on_output)
+                # Read stderr concurrently so a chatty stderr cannot fill its pipe
+                stderr_task = asyncio.ensure_future(process.stderr.read())
+                try:
+                    while True:
+                        chunk = await process.stdout.read(self.READ_CHUNK_SIZE)
+                        stream.feed(chunk)
+                        if not chunk:
+                            break
+                    stderr_output = await stderr_task
+                finally:
+                    # Timed out or cancelled: don't leave the stderr read behind
+                    stderr_task.cancel()
+                await process.wait()
+                return stream.getvalue(), stderr_output
+
+            output, stderr_output = await asyncio.wait_for(drain(), timeout=self.timeout)
+            return self._build_response(process.returncode, output, stderr_output)
+
+        except asyncio.CancelledError:
+            # Don't leave the agent running when the awaiting task is cancelled
+            if process is not None:
+                await self._akill(process)
+            raise
         except Exception as e:
-            return AgentResponse(
-                success=False,
-                output="",
-                error=str(e),
-                metadata={"exception_type": type(e).__name__, "chat_id": self.chat_id},
-            )
+            if isinstance(e, asyncio.TimeoutError) and process is not None:
+                await self._akill(process)
+            return self._error_response(e)
+        finally:
+            self._process = None
+
+    @staticmethod
+    async def _akill(process: asyncio.subprocess.Process) -> None:
+        """
+        Kill process and reap it, so its transport isn't finalized after the
+        loop closes.
+
+        wait() also waits for the pipes to close, which a grandchild of the
+        agent may hold open for a while after the kill, hence the bound.
+        """
+        if process.returncode is not None:
+            return
+        process.kill()
+        try:
+            await asyncio.wait_for(asyncio.shield(process.wait()), timeout=5)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pass
+
+    def close(self) -> None:
+        """Kill the cursor-cli process left running by an interrupted prompt."""
+        process = self._process
+        self._process = None
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class _LineStream:
+    """
+    Decode streamed agent output and forward it line by line.
+
+    Raw chunks are decoded incrementally as UTF-8 and accumulated in full;
+    complete lines are passed to the output callback (or printed), while a
+    trailing partial line is held back until its newline (or EOF) arrives.
+    """
+
+    def __init__(self, on_output: Optional[Callable[[str], None]] = None):
+        self._on_output = on_output
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = io.StringIO()
+        self._pending = ""
+
+    def _emit(self, text: str) -> None:
+        # Real-time output: use callback or print directly
+        if self._on_output:
+            self._on_output(text)
+        else:
+            print(text, end="", flush=True)
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed a raw chunk; an empty chunk marks EOF."""
+        text = self._decoder.decode(chunk, final=not chunk)
+        if text:
+            self._buf.write(text)
+            pending = self._pending + text
+            cut = pending.rfind("\n") + 1
+            if cut:
+                start = 0
+                while start < cut:
+                    end = pending.index("\n", start) + 1
+                    self._emit(pending[start:end])
+                    start = end
+                pending = pending[cut:]
+            self._pending = pending
+        if not chunk and self._pending:
+            self._emit(self._pending)
+            self._pending = ""
+
+    def getvalue(self) -> str:
+        """Return everything decoded so far."""
+        return self._buf.getvalue()
+
+
+# Maps each AgentType to its implementation; AgentCLI.create dispatches here
+_AGENT_REGISTRY: dict[AgentType, type[AgentCLI]] = {
+    AgentType.CURSOR_CLI: CursorCLI,
+}
@@ -4,26 +4,62 @@ CLI - Command line interface for AGEND.
 Provides a command-line interface for running tasks with the supervisor/worker pattern.
 """
 
-import json
+from __future__ import annotations
+
+import functools
 import sys
-from typing import Optional, Callable
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
-from agend.agent_cli import AgentType
-from agend.task_runner import TaskRunner, IterationLog
 from agend import session as sess
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from agend.agent_cli import AgentType
+    from agend.task_runner import IterationLog
+
+
+@functools.cache
+def _console() -> Console:
+    """
+    Get the shared rich console, importing rich on first use.
+
+    Invocations that never print through it (--version, --help) do not
+    import rich at all.
+    """
+    from rich.console import Console
+
+    return Console()
+
 
-console = Console()
+@functools.cache
+def _agent_type(name: str) -> AgentType:
+    """Resolve an agent type name, importing agent_cli only when a task runs."""
+    from agend.agent_cli import AgentType
 
+    return AgentType(name)
 
-def create_status_callback() -> Callable[[str], None]:
-    """Create a status callback for rich console output."""
+
+def create_status_callback(
+    flush_output: Optional[Callable[[], None]] = None,
+) -> Callable[[str], None]:
+    """
+    Create a status callback for rich console output.
+
+    Args:
+        flush_output: Optional callable run before each message, used to
+            flush buffered agent output so the two stay in order.
+    """
+    console = _console()
 
     def callback(message: str) -> None:
+        if flush_output:
+            flush_output()
         if message.startswith("==="):
             console.print(f"\n[bold blue]{message}[/bold blue]")
         elif message.startswith("✅"):
@@ -38,27 +74,98 @@ def create_status_callback() -> Callable[[str], None]:
     return callback
 
 
-def create_iteration_callback() -> Callable[[IterationLog], None]:
-    """Create an iteration complete callback."""
+def create_iteration_callback(
+    flush_output: Optional[Callable[[], None]] = None,
+) -> Callable[[IterationLog], None]:
+    """
+    Create an iteration complete callback.
+
+    Args:
+        flush_output: Optional callable run before printing, used to flush
+            buffered agent output so the two stay in order.
+    """
+    console = _console()
 
     def callback(log: IterationLog) -> None:
+        if flush_output:
+            flush_output()
         if log.supervisor_result and not log.supervisor_result.is_complete:
-            if log.supervisor_result.pending_items:
-                console.print("\n[yellow]待完成项目:[/yellow]")
-                for i, item in enumerate(log.supervisor_result.pending_items, 1):
-                    console.print(f"  [dim]{i}.[/dim] {item}")
+            pending_items = log.supervisor_result.pending_items
+            if pending_items:
+                # Render the whole list in one print rather than one per item
+                lines = ["\n[yellow]待完成项目:[/yellow]"]
+                lines.extend(
+                    f"  [dim]{i}.[/dim] {item}" for i, item in enumerate(pending_items, 1)
+                )
+                console.print("\n".join(lines))
 
     return callback
 
 
-def create_agent_output_callback() -> Callable[[str], None]:
-    """Create a callback for real-time agent output streaming."""
+class _BufferedAgentOutput:
+    """
+    Agent output callback that batches lines into fewer console prints.
 
-    def callback(line: str) -> None:
-        # Print agent output in real-time with a subtle style
-        console.print(line, end="", style="cyan", highlight=False)
+    Lines are printed right away unless the previous print was less than
+    FLUSH_INTERVAL seconds ago; then they are buffered until the interval
+    elapses (a timer flushes them) or FLUSH_SIZE characters accumulate.
+    Call flush() before printing anything else to the console.
+    """
 
-    return callback
+    FLUSH_INTERVAL = 0.05
+    FLUSH_SIZE = 16384
+
+    def __init__(self, console: Console):
+        self._console = console
+        self._buf: list[str] = []
+        self._size = 0
+        self._last_flush = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def __call__(self, line: str) -> None:
+        with self._lock:
+            self._buf.append(line)
+            self._size += len(line)
+            if (
+                self._size >= self.FLUSH_SIZE
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+            ):
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Print any buffered output now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            # Print agent output with a subtle style
+            self._console.print("".join(self._buf), end="", style="cyan", highlight=False)
+            self._buf.clear()
+            self._size = 0
+        self._last_flush = time.monotonic()
+
+
+def create_agent_output_callback() -> _BufferedAgentOutput:
+    """Create a (buffered) callback for real-time agent output streaming."""
+    return _BufferedAgentOutput(_console())
+
+
+def _write_result_json(result_dict: dict, output: str, pretty: bool) -> None:
+    """Write a run result to a JSON file (indented when pretty, else compact)."""
+    from agend import _json
+
+    dump = _json.dumps_indented if pretty else _json.dumps_compact
+    with open(output, "wb") as f:
+        f.write(dump(result_dict))
 
 
 def _run_task(
@@ -70,6 +177,7 @@ def _run_task(
     output: Optional[str],
     quiet: bool,
     session_id: Optional[str] = None,
+    pretty: bool = False,
     start_iteration: int = 1,
     pending_items: Optional[list[str]] = None,
     chat_id: Optional[str] = None,
@@ -77,6 +185,12 @@ def _run_task(
     """
     Internal function to run a task with the supervisor/worker loop.
     """
+    from rich.panel import Panel
+
+    from agend.task_runner import TaskRunner
+
+    console = _console()
+
     # Get or create session
     if session_id:
         session_info = sess.get_session(session_id)
@@ -101,30 +215,36 @@ def _run_task(
         )
     )
 
-    console.print(f"\n[dim]配置:[/dim]")
-    console.print(f"  Session: {session_id}")
-    console.print(f"  Agent类型: {agent_type}")
-    console.print(f"  模型: {model}")
-    console.print(f"  最大迭代次数: {max_iterations}")
-    console.print(f"  迭代间隔: {delay}秒")
+    # Render the config block in one print rather than one per line
+    config_lines = [
+        "\n[dim]配置:[/dim]",
+        f"  Session: {session_id}",
+        f"  Agent类型: {agent_type}",
+        f"  模型: {model}",
+        f"  最大迭代次数: {max_iterations}",
+        f"  迭代间隔: {delay}秒",
+    ]
     if start_iteration > 1:
-        console.print(f"  起始迭代: {start_iteration}")
+        config_lines.append(f"  起始迭代: {start_iteration}")
     if chat_id:
-        console.print(f"  恢复 Agent Chat: {chat_id}")
+        config_lines.append(f"  恢复 Agent Chat: {chat_id}")
+    console.print("\n".join(config_lines))
 
     # Results directory for this session
     results_dir = str(sess.get_agend_dir() / session_id)
 
     # Create runner
+    agent_output = None if quiet else create_agent_output_callback()
+    flush_output = agent_output.flush if agent_output else None
     runner = TaskRunner(
-        agent_type=AgentType(agent_type),
+        agent_type=_agent_type(agent_type),
         model=model,
         max_iterations=max_iterations,
         delay_between_iterations=delay,
         chat_id=chat_id,
-        on_status_update=None if quiet else create_status_callback(),
-        on_iteration_complete=None if quiet else create_iteration_callback(),
-        on_agent_output=None if quiet else create_agent_output_callback(),
+        on_status_update=None if quiet else create_status_callback(flush_output),
+        on_iteration_complete=None if quiet else create_iteration_callback(flush_output),
+        on_agent_output=agent_output,
         results_dir=results_dir,
         start_iteration=start_iteration,
         initial_pending_items=pending_items,
@@ -134,7 +254,11 @@ def _run_task(
     console.print("\n[bold]开始执行...[/bold]\n")
 
     try:
-        result = runner.run(task)
+        try:
+            result = runner.run(task)
+        finally:
+            if flush_output:
+                flush_output()
 
         # Bind agent chat_id to session if we got one
         if result.chat_id and not chat_id:
@@ -155,8 +279,7 @@ def _run_task(
 
         # Save to file if requested
         if output:
-            with open(output, "w", encoding="utf-8") as f:
-                json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+            _write_result_json(result.to_dict(), output, pretty)
             console.print(f"\n[dim]结果已保存到: {output}[/dim]")
 
         # Exit with appropriate code
@@ -220,7 +343,7 @@ class TaskOrSubcommandGroup(click.Group):
 
 @click.group(cls=TaskOrSubcommandGroup, invoke_without_command=True)
 @click.argument("task", required=False)
-@click.option("--file", "-f", type=click.Path(exists=True), help="Read task from file")
+@click.option("--file", "-f", type=str, metavar="PATH", help="Read task from file")
 @click.option("--continue", "continue_iterations", type=int, is_flag=False, flag_value=10, default=None,
               help="Continue last session (optionally specify iterations, default: 10)")
 @click.option("--resume", "-r", default=None, help="Resume a specific session by ID")
@@ -232,6 +355,7 @@ class TaskOrSubcommandGroup(click.Group):
 @click.option("--max-iterations", "-n", default=10, type=int, help="Maximum iterations (default: 10)")
 @click.option("--delay", "-d", default=1.0, type=float, help="Delay between iterations in seconds (default: 1.0)")
 @click.option("--output", "-o", type=click.Path(), help="Output file for results (JSON)")
+@click.option("--pretty", is_flag=True, help="Write --output as indented JSON")
 @click.option("--quiet", "-q", is_flag=True, help="Quiet mode")
 @click.pass_context
 def cli(
@@ -247,6 +371,7 @@ def cli(
     max_iterations: int,
     delay: float,
     output: Optional[str],
+    pretty: bool,
     quiet: bool,
 ):
     """AGEND - AI Agent Iterative Manager
@@ -265,16 +390,16 @@ def cli(
     if session_id and not task and not file and continue_iterations is None:
         session_info = sess.get_session(session_id)
         if not session_info:
-            console.print(f"[red]错误: 找不到 session {session_id}[/red]")
+            _console().print(f"[red]错误: 找不到 session {session_id}[/red]")
             sys.exit(1)
         sess.set_last_session_id(session_id)
         # Clear any existing lock and set new lock to this session
         sess.clear_session_lock()
         sess.set_session_lock(session_id)
-        console.print(f"[green]✅ 已切换到会话: {session_id}[/green]")
-        console.print(f"[dim]初始任务: {session_info.get('initial_prompt', 'N/A')}[/dim]")
+        _console().print(f"[green]✅ 已切换到会话: {session_id}[/green]")
+        _console().print(f"[dim]初始任务: {session_info.get('initial_prompt', 'N/A')}[/dim]")
         if session_info.get("agent_chat_id"):
-            console.print(f"[dim]Agent Chat ID: {session_info.get('agent_chat_id')}[/dim]")
+            _console().print(f"[dim]Agent Chat ID: {session_info.get('agent_chat_id')}[/dim]")
         return
 
     # Handle --chat-id only (bind to session)
@@ -286,11 +411,11 @@ def cli(
                 agent_chat_id=chat_id,
             )
             sess.set_last_session_id(use_session_id)
-            console.print(f"[green]✅ 创建新会话并绑定: {use_session_id}[/green]")
+            _console().print(f"[green]✅ 创建新会话并绑定: {use_session_id}[/green]")
         else:
             sess.bind_agent_chat_id(use_session_id, chat_id)
-            console.print(f"[green]✅ 已绑定 Agent Chat 到会话: {use_session_id}[/green]")
-        console.print(f"[dim]Agent Chat ID: {chat_id}[/dim]")
+            _console().print(f"[green]✅ 已绑定 Agent Chat 到会话: {use_session_id}[/green]")
+        _console().print(f"[dim]Agent Chat ID: {chat_id}[/dim]")
         return
 
     # Handle --continue mode
@@ -304,12 +429,12 @@ def cli(
                     cont_session_id = sessions[0]["id"]
 
         if not cont_session_id:
-            console.print("[red]错误: 没有找到可以继续的会话[/red]")
+            _console().print("[red]错误: 没有找到可以继续的会话[/red]")
             sys.exit(1)
 
         session_info = sess.get_session(cont_session_id)
         if not session_info:
-            console.print(f"[red]错误: 找不到 session {cont_session_id}[/red]")
+            _console().print(f"[red]错误: 找不到 session {cont_session_id}[/red]")
             sys.exit(1)
 
         start_iteration, pending_items = sess.get_continue_state(cont_session_id)
@@ -322,10 +447,10 @@ def cli(
 
         max_iterations = continue_iterations
 
-        console.print(f"[dim]继续会话: {cont_session_id}[/dim]")
-        console.print(f"[dim]从第 {start_iteration} 轮开始[/dim]")
+        _console().print(f"[dim]继续会话: {cont_session_id}[/dim]")
+        _console().print(f"[dim]从第 {start_iteration} 轮开始[/dim]")
         if pending_items:
-            console.print(f"[dim]待完成项目: {len(pending_items)} 项[/dim]")
+            _console().print(f"[dim]待完成项目: {len(pending_items)} 项[/dim]")
 
         _run_task(
             task=task,
@@ -336,6 +461,7 @@ def cli(
             output=output,
             quiet=quiet,
             session_id=cont_session_id,
+            pretty=pretty,
             start_iteration=start_iteration,
             pending_items=pending_items,
             chat_id=chat_id,
@@ -344,8 +470,12 @@ def cli(
 
     # Handle --file
     if file:
-        with open(file, "r", encoding="utf-8") as f:
-            task = f.read().strip()
+        # Validated here rather than by click so paths that never read the file skip the stat
+        try:
+            task = Path(file).read_text(encoding="utf-8").strip()
+        except (FileNotFoundError, IsADirectoryError):
+            _console().print(f"[red]错误: 文件不存在 {file}[/red]")
+            sys.exit(1)
 
     # No task provided, show help
     if not task:
@@ -371,6 +501,7 @@ def cli(
         output=output,
         quiet=quiet,
         session_id=session_id,
+        pretty=pretty,
         chat_id=chat_id,
     )
 
@@ -388,14 +519,51 @@ def create_chat_cmd(ctx):
     sess.set_last_session_id(created_session_id)
     # Lock this shell to use this session for subsequent commands
     sess.set_session_lock(created_session_id)
-    console.print(f"[green]✅ 创建新会话: {created_session_id}[/green]")
+    _console().print(f"[green]✅ 创建新会话: {created_session_id}[/green]")
     if chat_id:
-        console.print(f"[dim]绑定 Agent Chat: {chat_id}[/dim]")
-    console.print(f"[dim]后续命令将自动使用此会话[/dim]")
+        _console().print(f"[dim]绑定 Agent Chat: {chat_id}[/dim]")
+    _console().print(f"[dim]后续命令将自动使用此会话[/dim]")
+
+
+def _match_subcommand(args: list[str]) -> Optional[tuple[str, Optional[str], list[str]]]:
+    """
+    Detect `[--chat-id ID] <subcommand> ...` before Click parses the root group.
+
+    Only --chat-id is forwarded to subcommands, so any other leading token
+    (another root option, a task) returns None and leaves parsing to Click.
+
+    Returns:
+        Tuple of (subcommand name, chat_id, remaining args), or None
+    """
+    chat_id = None
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--chat-id" and i + 1 < len(args):
+            chat_id = args[i + 1]
+            i += 2
+        elif arg.startswith("--chat-id="):
+            chat_id = arg.split("=", 1)[1]
+            i += 1
+        else:
+            break
+
+    if i < len(args) and args[i] in cli.commands:
+        return args[i], chat_id, args[i + 1 :]
+    return None
 
 
 def main():
     """Entry point."""
+    # Fast path: dispatch known subcommands (e.g. create-chat, run from shell
+    # hooks) directly, skipping the root parser and TaskOrSubcommandGroup.invoke
+    matched = _match_subcommand(sys.argv[1:])
+    if matched:
+        name, chat_id, rest = matched
+        return cli.commands[name].main(
+            rest, prog_name=f"agend {name}", obj={"chat_id": chat_id}
+        )
+
     cli()
 
 
@@ -12,9 +12,14 @@ Storage structure:
         └── {YYYY_MM_DD_HH_mm_ss}.md   # Iteration logs
 """
 
+import atexit
+import functools
 import os
 import sqlite3
+import threading
+import time
 import uuid
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List
@@ -25,6 +30,58 @@ from contextlib import contextmanager
 AGEND_DIR = ".agend"
 DATABASE_FILE = "sessions.db"
 
+# Stored in PRAGMA user_version once _ensure_tables has brought a database up
+# to date; bump it whenever _ensure_tables gains a new table, column or index.
+SCHEMA_VERSION = 1
+
+# One connection per (database path, thread), kept open for the life of the
+# process. Opening a connection re-reads the schema and costs several syscalls,
+# and a single CLI invocation touches the database many times.
+_CONN_CACHE: dict[tuple[str, int], sqlite3.Connection] = {}
+# Guards _CONN_CACHE and the buffered iteration increments. The read caches
+# below are not locked: they are only touched with single dict operations,
+# and a racing reader at worst re-queries the database.
+_CONN_LOCK = threading.RLock()
+# Maximum parameters bound into a single DELETE ... IN (...) statement
+DELETE_BATCH_SIZE = 500
+# Milliseconds to wait on a database locked by another process (e.g. another shell)
+BUSY_TIMEOUT_MS = 30000
+# Database paths whose schema has been ensured by this process
+_TABLES_READY: set[str] = set()
+
+# Iteration count increments not yet written, keyed by (workspace, session_id).
+# Flushed in batches so the iteration loop does not commit once per iteration.
+_pending_increments: defaultdict[tuple[str, str], int] = defaultdict(int)
+# Number of IterationWriter closes between automatic flushes
+FLUSH_INCREMENTS_EVERY = 16
+_closes_since_flush = 0
+
+# SQL for the hottest queries, kept as module constants
+_SQL_GET_SESSION = "SELECT * FROM sessions WHERE id = ?"
+_SQL_GET_AGENT_CHAT_ID = "SELECT agent_chat_id FROM sessions WHERE id = ?"
+_SQL_INCREMENT_ITERATIONS = """
+    UPDATE sessions
+    SET iteration_count = iteration_count + ?
+    WHERE id = ?
+"""
+
+# Per-process read caches. Session data does not change underneath a single
+# CLI invocation, and every writer in this module updates or drops the
+# entries it touches. Keyed by (workspace, session_id) / (workspace, shell_pid).
+_SESSION_CACHE: dict[tuple[str, str], Optional[dict]] = {}
+_LAST_SESSION_CACHE: dict[tuple[str, str], Optional[str]] = {}
+_LOCKED_SESSION_CACHE: dict[tuple[str, str], Optional[str]] = {}
+
+# Latest iteration_XXX.json per (workspace, session_id), with the directory
+# mtime it was computed at
+_LATEST_RESULT_CACHE: dict[tuple[str, str], tuple[int, Optional[str]]] = {}
+
+# Result files at least this large are stream-parsed when only some keys are needed
+STREAM_PARSE_THRESHOLD = 64 * 1024
+
+# Session directories already created by this process, keyed by (workspace, session_id)
+_ENSURED_DIRS: set[tuple[str, str]] = set()
+
 
 def get_agend_dir(workspace: Optional[str] = None) -> Path:
     """
@@ -38,7 +95,19 @@ def get_agend_dir(workspace: Optional[str] = None) -> Path:
     """
     if workspace is None:
         workspace = os.getcwd()
-    return Path(workspace) / AGEND_DIR
+    return _agend_dir_for(str(workspace))
+
+
+@functools.lru_cache(maxsize=8)
+def _agend_dir_for(workspace: str) -> Path:
+    """Build (once per workspace) the absolute .agend directory path."""
+    return Path(os.path.abspath(workspace)) / AGEND_DIR
+
+
+@functools.lru_cache(maxsize=8)
+def _database_path_for(workspace: str) -> Path:
+    """Build (once per workspace) the absolute sessions.db path."""
+    return _agend_dir_for(workspace) / DATABASE_FILE
 
 
 def get_database_path(workspace: Optional[str] = None) -> Path:
@@ -51,7 +120,80 @@ def get_database_path(workspace: Optional[str] = None) -> Path:
     Returns:
         Path to sessions.db
     """
-    return get_agend_dir(workspace) / DATABASE_FILE
+    if workspace is None:
+        workspace = os.getcwd()
+    return _database_path_for(str(workspace))
+
+
+def _workspace_key(workspace: Optional[str]) -> str:
+    """Normalize a workspace argument for use as a dict key."""
+    return str(workspace) if workspace else os.getcwd()
+
+
+def _ts_compact(now: Optional[datetime] = None) -> str:
+    """Format a timestamp as YYYY_MM_DD_HH_mm_ss without going through strftime."""
+    n = now or datetime.now()
+    return (
+        f"{n.year:04d}_{n.month:02d}_{n.day:02d}_"
+        f"{n.hour:02d}_{n.minute:02d}_{n.second:02d}"
+    )
+
+
+def _ts_iso(
+    now: Optional[datetime] = None, sep: str = "T", timespec: str = "auto"
+) -> str:
+    """Format a timestamp as ISO 8601."""
+    n = now or datetime.now()
+    return n.isoformat(sep=sep, timespec=timespec)
+
+
+# (epoch second, formatted) pair reused by _ts_shell within the same second
+_SHELL_TS_CACHE: list = [None, ""]
+
+
+def _ts_shell() -> str:
+    """
+    Format the current local time (seconds precision) for shell_sessions.
+
+    shell_sessions.updated_at only records when a row was last touched, so
+    second precision is enough and the formatted string is reused for all
+    writes within the same second.
+    """
+    sec = int(time.time())
+    if _SHELL_TS_CACHE[0] != sec:
+        _SHELL_TS_CACHE[0] = sec
+        _SHELL_TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return _SHELL_TS_CACHE[1]
+
+
+def _open_db_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Open and initialize a new database connection.
+
+    Args:
+        db_path: Path to sessions.db
+
+    Returns:
+        sqlite3.Connection object with tables ensured
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # check_same_thread=False only so close_db_connections() can close every
+    # thread's connection at exit; each connection is otherwise used by one thread
+    conn = sqlite3.connect(
+        str(db_path), timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+    )
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+
+    key = str(db_path)
+    if key not in _TABLES_READY:
+        _ensure_tables(conn)
+        _TABLES_READY.add(key)
+    return conn
 
 
 @contextmanager
@@ -59,7 +201,9 @@ def get_db_connection(workspace: Optional[str] = None):
     """
     Context manager for database connections.
 
-    Ensures the database and tables exist before returning a connection.
+    Each thread's connection to a database is opened (and the tables ensured)
+    once and reused afterwards. The transaction is committed on clean exit and
+    rolled back on error; the connection itself stays open.
 
     Args:
         workspace: Workspace directory
@@ -68,31 +212,52 @@ def get_db_connection(workspace: Optional[str] = None):
         sqlite3.Connection object
     """
     db_path = get_database_path(workspace)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    key = (str(db_path), threading.get_ident())
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn = _CONN_CACHE.get(key)
+    if conn is None:
+        with _CONN_LOCK:
+            conn = _open_db_connection(db_path)
+            _CONN_CACHE[key] = conn
 
     try:
-        _ensure_tables(conn)
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
+
+
+def close_db_connections() -> None:
+    """Flush pending iteration counts and close all cached database connections."""
+    with _CONN_LOCK:
+        flush_pending_increments()
+        for conn in _CONN_CACHE.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _CONN_CACHE.clear()
+
+
+atexit.register(close_db_connections)
 
 
 def _ensure_tables(conn: sqlite3.Connection) -> None:
     """
     Ensure all required tables exist in the database.
 
+    Databases already at SCHEMA_VERSION are left untouched, so the
+    CREATE/ALTER checks run once per database rather than per process.
+
     Args:
         conn: Database connection
     """
     cursor = conn.cursor()
 
+    if cursor.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
     # Sessions table - stores session metadata/index
     # session_id: agend session uuid
     # agent_chat_id: cursor-agent chat_id bound to this session
@@ -110,6 +275,8 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
     )
 
     # Shell sessions table - maps shell PID to last used session
+    # shell_pid is the PRIMARY KEY, so every lookup by shell_pid is already an
+    # index (B-tree) lookup; no separate index is needed
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS shell_sessions (
@@ -123,12 +290,13 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
     )
 
     # Add locked_session_id column if not exists (migration)
-    try:
+    columns = {
+        row["name"] for row in cursor.execute("PRAGMA table_info(shell_sessions)")
+    }
+    if "locked_session_id" not in columns:
         cursor.execute(
             "ALTER TABLE shell_sessions ADD COLUMN locked_session_id TEXT"
         )
-    except sqlite3.OperationalError:
-        pass  # Column already exists
 
     # Create index for common queries
     cursor.execute(
@@ -137,7 +305,14 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
         ON sessions(created_at DESC)
     """
     )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sessions_chat
+        ON sessions(agent_chat_id)
+    """
+    )
 
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
 
 
@@ -169,7 +344,11 @@ def ensure_session_dir(session_id: str, workspace: Optional[str] = None) -> Path
     """
     agend_dir = get_agend_dir(workspace)
     session_dir = agend_dir / session_id
-    session_dir.mkdir(parents=True, exist_ok=True)
+
+    key = (_workspace_key(workspace), session_id)
+    if key not in _ENSURED_DIRS:
+        session_dir.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
     return session_dir
 
 
@@ -189,7 +368,9 @@ def get_task_file_path(session_id: str, workspace: Optional[str] = None) -> Path
 
 
 def get_iteration_file_path(
-    session_id: str, workspace: Optional[str] = None
+    session_id: str,
+    workspace: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> Path:
     """
     Get the path for a new iteration file with timestamp.
@@ -197,12 +378,13 @@ def get_iteration_file_path(
     Args:
         session_id: The session ID
         workspace: Workspace directory
+        now: Timestamp to name the file after (default: current time)
 
     Returns:
         Path to the iteration file
     """
     session_dir = ensure_session_dir(session_id, workspace)
-    timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+    timestamp = _ts_compact(now)
     return session_dir / f"{timestamp}.md"
 
 
@@ -228,13 +410,14 @@ def create_session(
         The new session ID (uuid)
     """
     session_id = create_session_id()
+    timestamp = _ts_iso()
+    workspace_str = str(workspace) if workspace else os.getcwd()
+    task_content = f"# Task\n\n{initial_prompt}\n".encode("utf-8")
 
+    # Insert the index row and save the initial task in one transaction:
+    # the commit happens once on exit, and a failed file write rolls back the row
     with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        timestamp = datetime.now().isoformat()
-        workspace_str = str(workspace) if workspace else os.getcwd()
-
-        cursor.execute(
+        conn.execute(
             """
             INSERT INTO sessions (id, agent_chat_id, created_at, initial_prompt, workspace, iteration_count)
             VALUES (?, ?, ?, ?, ?, 0)
@@ -242,9 +425,11 @@ def create_session(
             (session_id, agent_chat_id, timestamp, initial_prompt, workspace_str),
         )
 
-    # Create session directory and save initial task
-    task_file = get_task_file_path(session_id, workspace)
-    task_file.write_text(f"# Task\n\n{initial_prompt}\n", encoding="utf-8")
+        # Create session directory and save initial task
+        task_file = get_task_file_path(session_id, workspace)
+        task_file.write_bytes(task_content)
+
+    _SESSION_CACHE.pop((_workspace_key(workspace), session_id), None)
 
     return session_id
 
@@ -263,8 +448,7 @@ def bind_agent_chat_id(
         workspace: Workspace directory
     """
     with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
+        conn.execute(
             """
             UPDATE sessions
             SET agent_chat_id = ?
@@ -272,6 +456,7 @@ def bind_agent_chat_id(
             """,
             (agent_chat_id, session_id),
         )
+    _SESSION_CACHE.pop((_workspace_key(workspace), session_id), None)
 
 
 def get_session(session_id: str, workspace: Optional[str] = None) -> Optional[dict]:
@@ -285,16 +470,19 @@ def get_session(session_id: str, workspace: Optional[str] = None) -> Optional[di
     Returns:
         Dict with session info, or None if not found
     """
-    with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM sessions WHERE id = ?",
-            (session_id,),
-        )
-        row = cursor.fetchone()
-        if row:
-            return dict(row)
+    key = (_workspace_key(workspace), session_id)
+    if key in _SESSION_CACHE:
+        session = _SESSION_CACHE[key]
+    else:
+        with get_db_connection(workspace) as conn:
+            row = conn.execute(_SQL_GET_SESSION, (session_id,)).fetchone()
+            session = dict(row) if row else None
+        _SESSION_CACHE[key] = session
+
+    if session is None:
         return None
+    # Return a copy so callers cannot mutate the cached entry
+    return _apply_pending_increments(dict(session), workspace)
 
 
 def get_agent_chat_id(session_id: str, workspace: Optional[str] = None) -> Optional[str]:
@@ -308,30 +496,65 @@ def get_agent_chat_id(session_id: str, workspace: Optional[str] = None) -> Optio
     Returns:
         The agent chat ID, or None if not bound
     """
-    session = get_session(session_id, workspace)
-    if session:
-        return session.get("agent_chat_id")
-    return None
+    # Use the row get_session() cached, if any (only get_session fills the cache)
+    key = (_workspace_key(workspace), session_id)
+    if key in _SESSION_CACHE:
+        session = _SESSION_CACHE[key]
+        return session.get("agent_chat_id") if session else None
+
+    # Single-column lookup: read a plain tuple instead of building a Row and dict
+    with get_db_connection(workspace) as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        row = cursor.execute(_SQL_GET_AGENT_CHAT_ID, (session_id,)).fetchone()
+        return row[0] if row else None
 
 
 def increment_iteration_count(session_id: str, workspace: Optional[str] = None) -> None:
     """
     Increment the iteration count for a session.
 
+    The increment is buffered in memory; see flush_pending_increments().
+
     Args:
         session_id: The session ID
         workspace: Workspace directory
     """
-    with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE sessions
-            SET iteration_count = iteration_count + 1
-            WHERE id = ?
-            """,
-            (session_id,),
-        )
+    with _CONN_LOCK:
+        _pending_increments[(_workspace_key(workspace), session_id)] += 1
+
+
+def flush_pending_increments() -> None:
+    """
+    Write all buffered iteration count increments to the database.
+
+    Issues one UPDATE per session and commits once per workspace.
+    """
+    global _closes_since_flush
+
+    with _CONN_LOCK:
+        _closes_since_flush = 0
+        if not _pending_increments:
+            return
+
+        by_workspace: dict[str, list[tuple[int, str]]] = defaultdict(list)
+        for key, delta in _pending_increments.items():
+            workspace, session_id = key
+            by_workspace[workspace].append((delta, session_id))
+            _SESSION_CACHE.pop(key, None)
+        _pending_increments.clear()
+
+        for workspace, updates in by_workspace.items():
+            with get_db_connection(workspace) as conn:
+                conn.executemany(_SQL_INCREMENT_ITERATIONS, updates)
+
+
+def _apply_pending_increments(session: dict, workspace: Optional[str]) -> dict:
+    """Add any buffered increments to a session dict's iteration_count."""
+    delta = _pending_increments.get((_workspace_key(workspace), session["id"]))
+    if delta:
+        session["iteration_count"] = (session.get("iteration_count") or 0) + delta
+    return session
 
 
 def list_sessions(
@@ -351,16 +574,15 @@ def list_sessions(
         List of session dicts
     """
     with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
+        rows = conn.execute(
             """
             SELECT * FROM sessions
             ORDER BY created_at DESC
             LIMIT ? OFFSET ?
             """,
             (limit, offset),
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        ).fetchall()
+        return [_apply_pending_increments(dict(row), workspace) for row in rows]
 
 
 def search_sessions(
@@ -380,10 +602,9 @@ def search_sessions(
         List of matching session dicts
     """
     with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
         search_pattern = f"%{query}%"
 
-        cursor.execute(
+        rows = conn.execute(
             """
             SELECT * FROM sessions
             WHERE initial_prompt LIKE ?
@@ -391,8 +612,8 @@ def search_sessions(
             LIMIT ?
             """,
             (search_pattern, limit),
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        ).fetchall()
+        return [_apply_pending_increments(dict(row), workspace) for row in rows]
 
 
 # ============================================================================
@@ -405,6 +626,8 @@ class IterationWriter:
     A writer for streaming iteration content to a file.
 
     Creates the file immediately and allows real-time appending of content.
+    Content is buffered and flushed once flush_threshold bytes accumulate,
+    at section boundaries, on close, or when flush() is called explicitly.
     """
 
     def __init__(
@@ -412,6 +635,7 @@ class IterationWriter:
         session_id: str,
         iteration: int,
         workspace: Optional[str] = None,
+        flush_threshold: int = 16384,
     ):
         """
         Create a new iteration file and write the header.
@@ -420,23 +644,27 @@ class IterationWriter:
             session_id: The session ID
             iteration: The iteration number
             workspace: Workspace directory
+            flush_threshold: Buffered bytes that trigger a flush
         """
         self.session_id = session_id
         self.iteration = iteration
         self.workspace = workspace
-        self.file_path = get_iteration_file_path(session_id, workspace)
-        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.flush_threshold = flush_threshold
+        now = datetime.now()
+        self.file_path = get_iteration_file_path(session_id, workspace, now=now)
+        self.timestamp = _ts_iso(now, sep=" ", timespec="seconds")
         self._closed = False
+        self._buf = bytearray()
 
         # Create and open the file immediately
-        self._file = open(self.file_path, "w", encoding="utf-8")
+        self._fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
         # Write the header
         header = f"""# Iteration {iteration} - {self.timestamp}
 
 """
-        self._file.write(header)
-        self._file.flush()
+        self._buf.extend(header.encode("utf-8"))
+        self.flush()
 
     def write(self, content: str) -> None:
         """
@@ -447,8 +675,20 @@ class IterationWriter:
         """
         if self._closed:
             return
-        self._file.write(content)
-        self._file.flush()
+        self._buf.extend(content.encode("utf-8"))
+        if len(self._buf) >= self.flush_threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered content so readers tailing the file see it."""
+        if self._closed or not self._buf:
+            return
+        view = memoryview(self._buf)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        view.release()
+        self._buf.clear()
 
     def write_section(self, title: str, content: str) -> None:
         """
@@ -459,6 +699,7 @@ class IterationWriter:
             content: Section content
         """
         self.write(f"\n## {title}\n\n{content}\n")
+        self.flush()
 
     def close(self) -> Path:
         """
@@ -467,14 +708,20 @@ class IterationWriter:
         Returns:
             Path to the saved file
         """
+        global _closes_since_flush
+
         if self._closed:
             return self.file_path
 
+        self.flush()
         self._closed = True
-        self._file.close()
+        os.close(self._fd)
 
-        # Update iteration count in index
+        # Update iteration count in index (buffered, flushed every few closes)
         increment_iteration_count(self.session_id, self.workspace)
+        _closes_since_flush += 1
+        if _closes_since_flush >= FLUSH_INCREMENTS_EVERY:
+            flush_pending_increments()
 
         return self.file_path
 
@@ -523,12 +770,15 @@ def get_iteration_files(
         List of iteration file paths (sorted by name, newest first)
     """
     session_dir = get_agend_dir(workspace) / session_id
-    if not session_dir.exists():
+    try:
+        with os.scandir(session_dir) as it:
+            # Exclude task.md, only get timestamped files
+            names = [e.name for e in it if e.name.endswith(".md") and e.name != "task.md"]
+    except FileNotFoundError:
         return []
 
-    # Exclude task.md, only get timestamped files
-    files = [f for f in session_dir.glob("*.md") if f.name != "task.md"]
-    return sorted(files, reverse=True)  # Newest first
+    names.sort(reverse=True)  # Newest first
+    return [session_dir / name for name in names]
 
 
 def read_task(session_id: str, workspace: Optional[str] = None) -> Optional[str]:
@@ -543,12 +793,11 @@ def read_task(session_id: str, workspace: Optional[str] = None) -> Optional[str]
         Task content, or None if file doesn't exist
     """
     task_file = get_task_file_path(session_id, workspace)
-    if not task_file.exists():
+    try:
+        return task_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
 
-    with open(task_file, "r", encoding="utf-8") as f:
-        return f.read()
-
 
 def read_iteration(file_path: Path) -> Optional[str]:
     """
@@ -560,28 +809,62 @@ def read_iteration(file_path: Path) -> Optional[str]:
     Returns:
         File content, or None if file doesn't exist
     """
-    if not file_path.exists():
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
-
 
 # ============================================================================
 # Shell Session Tracking (SQLite)
 # ============================================================================
 
 
+# Shell identifier detected by this process (at most one entry); cleared in
+# forked children, whose process tree differs from the parent's
+_SHELL_PID_CACHE: list[str] = []
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SHELL_PID_CACHE.clear)
+
+# Terminal-specific environment variables that identify a window/session,
+# probed in order
+_SESSION_ENV_VARS = (
+    "TERM_SESSION_ID",
+    "ITERM_SESSION_ID",
+    "KITTY_WINDOW_ID",
+    "WEZTERM_PANE",
+    "ALACRITTY_WINDOW_ID",
+    "WINDOWID",
+)
+
+
 def get_shell_pid() -> str:
     """
     Get a stable identifier for the current shell session.
 
+    The identifier cannot change during the life of a process, so it is
+    detected once and cached.
+
+    Returns:
+        String identifier for the shell session
+    """
+    if not _SHELL_PID_CACHE:
+        _SHELL_PID_CACHE.append(_detect_shell_pid())
+    return _SHELL_PID_CACHE[0]
+
+
+def _detect_shell_pid() -> str:
+    """
+    Detect a stable identifier for the current shell session.
+
     We cannot rely on os.getppid() because each command execution may have
     a different parent process (e.g., the shell forks for each command).
     
     Priority order:
     1. AGEND_SHELL_ID environment variable (explicit, most reliable)
-    2. TTY name (stable within a terminal session, most reliable automatic method)
+    2. TTY name (stable within a terminal session, most reliable automatic method),
+       taken from $TTY when the shell exports it (zsh), otherwise via ttyname()
     3. Terminal session IDs (macOS Terminal, iTerm2, etc.)
     4. Interactive shell PID from process tree (grandparent PID)
     5. os.getppid() as last resort
@@ -594,8 +877,14 @@ def get_shell_pid() -> str:
     shell_id = os.environ.get("AGEND_SHELL_ID")
     if shell_id:
         return shell_id
+
+    # 2. zsh exports the controlling terminal as $TTY; reading it costs no
+    #    syscalls and still works when stdin/stdout/stderr are redirected
+    tty_env = os.environ.get("TTY")
+    if tty_env:
+        return f"tty:{tty_env}"
     
-    # 2. Try to get the TTY name - most stable within a terminal session
+    #    Otherwise try to get the TTY name - most stable within a terminal session
     #    Try multiple file descriptors as some may be redirected
     tty_name = None
     
@@ -620,8 +909,7 @@ def get_shell_pid() -> str:
         return f"tty:{tty_name}"
     
     # 3. Check terminal-specific session IDs
-    for env_var in ("TERM_SESSION_ID", "ITERM_SESSION_ID", "KITTY_WINDOW_ID", 
-                    "WEZTERM_PANE", "ALACRITTY_WINDOW_ID", "WINDOWID"):
+    for env_var in _SESSION_ENV_VARS:
         session_id = os.environ.get(env_var)
         if session_id:
             return f"{env_var}:{session_id}"
@@ -630,25 +918,51 @@ def get_shell_pid() -> str:
     #    When user runs `agend`, the process tree typically looks like:
     #    zsh (interactive shell) -> fork -> agend (Python)
     #    So we want the grandparent PID (the interactive shell)
+    grandparent_pid = _get_parent_pid(os.getppid())
+    if grandparent_pid:
+        return f"shell:{grandparent_pid}"
+
+    # 5. Fall back to ppid (may vary between commands, but better than nothing)
+    return str(os.getppid())
+
+
+def _get_parent_pid(pid: int) -> Optional[str]:
+    """
+    Get the parent PID of a process.
+
+    Reads /proc/<pid>/stat on Linux and falls back to `ps` elsewhere (macOS).
+
+    Args:
+        pid: Process ID to look up
+
+    Returns:
+        The parent PID as a string, or None if it could not be determined
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            data = f.read()
+        # Format: "pid (comm) state ppid ..."; comm may contain spaces or
+        # parentheses, so split after the last ')'
+        return data[data.rindex(b")") + 1 :].split()[1].decode()
+    except (OSError, ValueError, IndexError):
+        pass
+
     try:
         import subprocess
-        ppid = os.getppid()
-        # Get the parent of our parent (the interactive shell)
+
         result = subprocess.run(
-            ["ps", "-p", str(ppid), "-o", "ppid="],
+            ["ps", "-p", str(pid), "-o", "ppid="],
             capture_output=True,
             text=True,
             timeout=1
         )
         if result.returncode == 0:
-            grandparent_pid = result.stdout.strip()
-            if grandparent_pid and grandparent_pid.isdigit():
-                return f"shell:{grandparent_pid}"
+            parent_pid = result.stdout.strip()
+            if parent_pid and parent_pid.isdigit():
+                return parent_pid
     except Exception:
         pass
-    
-    # 5. Fall back to ppid (may vary between commands, but better than nothing)
-    return str(os.getppid())
+    return None
 
 
 def get_last_session_id(
@@ -667,6 +981,10 @@ def get_last_session_id(
     if shell_pid is None:
         shell_pid = get_shell_pid()
 
+    key = (_workspace_key(workspace), shell_pid)
+    if key in _LAST_SESSION_CACHE:
+        return _LAST_SESSION_CACHE[key]
+
     with get_db_connection(workspace) as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -674,9 +992,10 @@ def get_last_session_id(
             (shell_pid,),
         )
         row = cursor.fetchone()
-        if row:
-            return row["session_id"]
-        return None
+        last_session_id = row["session_id"] if row else None
+
+    _LAST_SESSION_CACHE[key] = last_session_id
+    return last_session_id
 
 
 def get_locked_session_id_for_shell(
@@ -695,6 +1014,10 @@ def get_locked_session_id_for_shell(
     if shell_pid is None:
         shell_pid = get_shell_pid()
 
+    key = (_workspace_key(workspace), shell_pid)
+    if key in _LOCKED_SESSION_CACHE:
+        return _LOCKED_SESSION_CACHE[key]
+
     with get_db_connection(workspace) as conn:
         cursor = conn.cursor()
         cursor.execute(
@@ -702,9 +1025,11 @@ def get_locked_session_id_for_shell(
             (shell_pid,),
         )
         row = cursor.fetchone()
-        if row and row["locked_session_id"]:
-            return row["locked_session_id"]
-        return None
+        locked_session_id = row["locked_session_id"] if row else None
+
+    locked_session_id = locked_session_id or None
+    _LOCKED_SESSION_CACHE[key] = locked_session_id
+    return locked_session_id
 
 
 def set_last_session_id(session_id: str, workspace: Optional[str] = None) -> None:
@@ -716,26 +1041,26 @@ def set_last_session_id(session_id: str, workspace: Optional[str] = None) -> Non
         workspace: Workspace directory
     """
     shell_pid = get_shell_pid()
-    timestamp = datetime.now().isoformat()
 
-    with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        # Preserve locked_session_id if exists
-        cursor.execute(
-            "SELECT locked_session_id FROM shell_sessions WHERE shell_pid = ?",
-            (shell_pid,),
-        )
-        row = cursor.fetchone()
-        locked_session_id = row["locked_session_id"] if row else None
+    # Skip the write transaction when the shell already points at this session
+    if get_last_session_id(workspace, shell_pid) == session_id:
+        return
 
-        cursor.execute(
+    timestamp = _ts_shell()
+
+    with get_db_connection(workspace) as conn:
+        # Upsert leaves locked_session_id untouched on existing rows
+        conn.execute(
             """
-            INSERT OR REPLACE INTO shell_sessions 
-            (shell_pid, session_id, updated_at, locked_session_id)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO shell_sessions (shell_pid, session_id, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(shell_pid) DO UPDATE SET
+                session_id = excluded.session_id,
+                updated_at = excluded.updated_at
             """,
-            (shell_pid, session_id, timestamp, locked_session_id),
+            (shell_pid, session_id, timestamp),
         )
+    _LAST_SESSION_CACHE[(_workspace_key(workspace), shell_pid)] = session_id
 
 
 def get_locked_session_id(workspace: Optional[str] = None) -> Optional[str]:
@@ -748,18 +1073,7 @@ def get_locked_session_id(workspace: Optional[str] = None) -> Optional[str]:
     Returns:
         The locked session ID, or None if not locked
     """
-    shell_pid = get_shell_pid()
-
-    with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT locked_session_id FROM shell_sessions WHERE shell_pid = ?",
-            (shell_pid,),
-        )
-        row = cursor.fetchone()
-        if row and row["locked_session_id"]:
-            return row["locked_session_id"]
-        return None
+    return get_locked_session_id_for_shell(workspace)
 
 
 def set_session_lock(
@@ -773,35 +1087,34 @@ def set_session_lock(
         workspace: Workspace directory
     """
     shell_pid = get_shell_pid()
-    timestamp = datetime.now().isoformat()
+
+    # Skip the write transaction when the shell is already locked to this session
+    if get_locked_session_id_for_shell(workspace, shell_pid) == session_id:
+        return
+
+    timestamp = _ts_shell()
 
     with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
-        # Check if row exists
-        cursor.execute(
-            "SELECT session_id FROM shell_sessions WHERE shell_pid = ?",
-            (shell_pid,),
+        # A new row also records the session as the shell's last session;
+        # an existing row only has its lock updated
+        conn.execute(
+            """
+            INSERT INTO shell_sessions
+            (shell_pid, session_id, updated_at, locked_session_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(shell_pid) DO UPDATE SET
+                locked_session_id = excluded.locked_session_id,
+                updated_at = excluded.updated_at
+            """,
+            (shell_pid, session_id, timestamp, session_id),
         )
-        row = cursor.fetchone()
 
-        if row:
-            cursor.execute(
-                """
-                UPDATE shell_sessions 
-                SET locked_session_id = ?, updated_at = ?
-                WHERE shell_pid = ?
-                """,
-                (session_id, timestamp, shell_pid),
-            )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO shell_sessions 
-                (shell_pid, session_id, updated_at, locked_session_id)
-                VALUES (?, ?, ?, ?)
-                """,
-                (shell_pid, session_id, timestamp, session_id),
-            )
+    key = (_workspace_key(workspace), shell_pid)
+    _LOCKED_SESSION_CACHE[key] = session_id
+    # Unless a last session was already known (row existed and is unchanged),
+    # the row may have just been inserted; re-read on next access
+    if _LAST_SESSION_CACHE.get(key) is None:
+        _LAST_SESSION_CACHE.pop(key, None)
 
 
 def clear_session_lock(workspace: Optional[str] = None) -> Optional[str]:
@@ -815,9 +1128,18 @@ def clear_session_lock(workspace: Optional[str] = None) -> Optional[str]:
         The previously locked session ID, or None if wasn't locked
     """
     shell_pid = get_shell_pid()
-    timestamp = datetime.now().isoformat()
+
+    # Nothing to clear: skip the write transaction
+    if get_locked_session_id_for_shell(workspace, shell_pid) is None:
+        return None
+
+    timestamp = _ts_shell()
 
     with get_db_connection(workspace) as conn:
+        # Read and clear under one write transaction (a single commit), so
+        # another process cannot change the lock in between
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
         cursor = conn.cursor()
         cursor.execute(
             "SELECT locked_session_id FROM shell_sessions WHERE shell_pid = ?",
@@ -835,8 +1157,42 @@ def clear_session_lock(workspace: Optional[str] = None) -> Optional[str]:
                 """,
                 (timestamp, shell_pid),
             )
+    _LOCKED_SESSION_CACHE[(_workspace_key(workspace), shell_pid)] = None
+
+    return old_locked
+
+
+def _pid_from_shell_id(shell_pid: str) -> Optional[str]:
+    """Extract the process ID from a PID-based shell identifier, if it is one."""
+    if shell_pid.startswith("shell:"):
+        shell_pid = shell_pid[len("shell:") :]
+    return shell_pid if shell_pid.isdigit() else None
+
+
+def _list_live_pids() -> Optional[set[str]]:
+    """
+    List all live process IDs in one pass over /proc.
 
-        return old_locked
+    Returns:
+        Set of PID strings, or None where /proc is unavailable (macOS)
+    """
+    try:
+        return {name for name in os.listdir("/proc") if name.isdigit()}
+    except OSError:
+        return None
+
+
+def _is_pid_alive(pid: str, live_pids: Optional[set[str]]) -> bool:
+    """Check whether a process exists, using the /proc listing when available."""
+    if live_pids is not None:
+        return pid in live_pids
+    try:
+        os.kill(int(pid), 0)  # Signal 0 just checks if process exists
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, but owned by another user
+    return True
 
 
 def cleanup_stale_sessions(workspace: Optional[str] = None) -> int:
@@ -858,23 +1214,32 @@ def cleanup_stale_sessions(workspace: Optional[str] = None) -> int:
         cursor.execute("SELECT shell_pid FROM shell_sessions")
         rows = cursor.fetchall()
 
+        live_pids = _list_live_pids()
         stale_pids = []
         for row in rows:
             shell_pid = row["shell_pid"]
-            try:
-                pid = int(shell_pid)
-                os.kill(pid, 0)  # Signal 0 just checks if process exists
-            except (ValueError, ProcessLookupError, PermissionError):
+            pid = _pid_from_shell_id(shell_pid)
+            if pid is None:
+                # tty / terminal-session identifiers have no process to check
+                continue
+            if not _is_pid_alive(pid, live_pids):
                 stale_pids.append(shell_pid)
 
-        if stale_pids:
-            placeholders = ",".join("?" * len(stale_pids))
+        # Delete in batches to stay under SQLite's bound-parameter limit
+        # (999 on older builds); all batches commit in one transaction
+        for start in range(0, len(stale_pids), DELETE_BATCH_SIZE):
+            batch = stale_pids[start : start + DELETE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
             cursor.execute(
                 f"DELETE FROM shell_sessions WHERE shell_pid IN ({placeholders})",
-                stale_pids,
+                batch,
             )
 
-        return len(stale_pids)
+    if stale_pids:
+        _LAST_SESSION_CACHE.clear()
+        _LOCKED_SESSION_CACHE.clear()
+
+    return len(stale_pids)
 
 
 # ============================================================================
@@ -892,18 +1257,17 @@ def get_session_stats(workspace: Optional[str] = None) -> dict:
     Returns:
         Dict with statistics
     """
-    with get_db_connection(workspace) as conn:
-        cursor = conn.cursor()
+    flush_pending_increments()
 
-        cursor.execute("SELECT COUNT(*) as count FROM sessions")
-        session_count = cursor.fetchone()["count"]
-
-        cursor.execute("SELECT SUM(iteration_count) as total FROM sessions")
-        row = cursor.fetchone()
-        iteration_count = row["total"] if row["total"] else 0
-
-        cursor.execute("SELECT COUNT(*) as count FROM shell_sessions")
-        shell_session_count = cursor.fetchone()["count"]
+    with get_db_connection(workspace) as conn:
+        session_count, iteration_count, shell_session_count = conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM sessions),
+                (SELECT COALESCE(SUM(iteration_count), 0) FROM sessions),
+                (SELECT COUNT(*) FROM shell_sessions)
+            """
+        ).fetchone()
 
         return {
             "sessions": session_count,
@@ -931,8 +1295,88 @@ def session_exists(session_id: str, workspace: Optional[str] = None) -> bool:
 # ============================================================================
 
 
+def _find_latest_iteration_file(
+    results_dir: Path, workspace: Optional[str], session_id: str
+) -> Optional[str]:
+    """
+    Find the highest-numbered iteration_XXX.json file in a directory.
+
+    Scans once, keeping the running maximum, and remembers the answer until
+    the directory's mtime changes (i.e. a file is added or removed).
+
+    Returns:
+        Path of the latest result file, or None if there are none
+    """
+    key = (_workspace_key(workspace), session_id)
+    try:
+        mtime_ns = os.stat(results_dir).st_mtime_ns
+    except OSError:
+        _LATEST_RESULT_CACHE.pop(key, None)
+        return None
+
+    cached = _LATEST_RESULT_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    latest_path = None
+    latest_num = -1
+    with os.scandir(results_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("iteration_") and name.endswith(".json"):
+                try:
+                    num = int(name[len("iteration_") : -len(".json")])
+                except ValueError:
+                    continue
+                if num > latest_num:
+                    latest_num, latest_path = num, entry.path
+
+    _LATEST_RESULT_CACHE[key] = (mtime_ns, latest_path)
+    return latest_path
+
+
+def _load_json_keys(file_path: str, keys: tuple[str, ...]) -> dict:
+    """
+    Load only the given top-level keys from a JSON object file.
+
+    Large files are stream-parsed with ijson (if installed), stopping as soon
+    as every requested key has been seen; otherwise the file is parsed whole.
+
+    Raises:
+        ValueError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    import json
+
+    if os.path.getsize(file_path) >= STREAM_PARSE_THRESHOLD:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        if ijson is not None:
+            wanted = set(keys)
+            found = {}
+            with open(file_path, "rb") as f:
+                try:
+                    for key, value in ijson.kvitems(f, "", use_float=True):
+                        if key in wanted:
+                            found[key] = value
+                            if len(found) == len(wanted):
+                                break
+                except ijson.JSONError as e:
+                    raise ValueError(str(e)) from e
+            return found
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {key: data[key] for key in keys if key in data}
+
+
 def get_latest_iteration_result(
-    session_id: str, workspace: Optional[str] = None
+    session_id: str,
+    workspace: Optional[str] = None,
+    keys: Optional[tuple[str, ...]] = None,
 ) -> Optional[dict]:
     """
     Get the latest iteration result from a session's results directory.
@@ -942,6 +1386,7 @@ def get_latest_iteration_result(
     Args:
         session_id: The session ID
         workspace: Workspace directory
+        keys: Optional top-level keys to load; other keys are skipped
 
     Returns:
         Dict with iteration result data, or None if no results found
@@ -949,19 +1394,17 @@ def get_latest_iteration_result(
     import json
 
     results_dir = get_agend_dir(workspace) / session_id
-    if not results_dir.exists():
-        return None
-
-    # Find all iteration files
-    result_files = sorted(results_dir.glob("iteration_*.json"), reverse=True)
-    if not result_files:
+    latest_file = _find_latest_iteration_file(results_dir, workspace, session_id)
+    if latest_file is None:
         return None
 
     # Read the latest one
     try:
-        with open(result_files[0], "r", encoding="utf-8") as f:
+        if keys:
+            return _load_json_keys(latest_file, keys)
+        with open(latest_file, "r", encoding="utf-8") as f:
             return json.load(f)
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, IOError):  # json.JSONDecodeError is a ValueError
         return None
 
 
@@ -981,7 +1424,9 @@ def get_continue_state(
         Tuple of (next_iteration, pending_items).
         Returns (1, []) if no previous state found.
     """
-    result = get_latest_iteration_result(session_id, workspace)
+    result = get_latest_iteration_result(
+        session_id, workspace, keys=("iteration", "pending_items")
+    )
     if not result:
         return 1, []
 
@@ -6,15 +6,252 @@ feedback on what remains to be done. It maintains a todo list file to track
 progress across iterations.
 """
 
+import atexit
 import json
 import os
 import re
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Callable
+from typing import Any, Optional, Callable, Iterable
 from pathlib import Path
 
-from agend.agent_cli import AgentCLI, AgentType, AgentResponse
+from agend import _json
+from agend.agent_cli import AgentCLI, AgentType, AgentResponse, _DATACLASS_SLOTS
+
+
+# Parsed todo files: path -> (st_mtime_ns, st_size, data); see TodoList.load
+_TODO_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+# ============================================================================
+# Background todo file writes
+# ============================================================================
+
+# Latest unwritten payload per todo file; older payloads are overwritten, so
+# back-to-back saves collapse into a single write
+_TODO_WRITES: dict[Path, bytes] = {}
+_TODO_WRITE_LOCK = threading.Lock()
+_TODO_WRITE_FUTURE: Optional[Future] = None
+# Failed background write per todo file, until raised for (or rewritten to)
+# that file; guarded by _TODO_WRITE_LOCK
+_TODO_WRITE_ERRORS: dict[Path, BaseException] = {}
+_TODO_WRITE_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _write_todo_file(filepath: Path, data: bytes) -> None:
+    """Atomically replace filepath with data."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, filepath)
+    _TODO_CACHE.pop(str(filepath), None)
+
+
+def _drain_todo_writes() -> None:
+    """Write queued payloads until none are left (runs on the writer thread)."""
+    global _TODO_WRITE_FUTURE
+    while True:
+        with _TODO_WRITE_LOCK:
+            if not _TODO_WRITES:
+                _TODO_WRITE_FUTURE = None
+                return
+            filepath, data = _TODO_WRITES.popitem()
+        try:
+            _write_todo_file(filepath, data)
+        except Exception as e:
+            # Surfaced by the next load or save of this file
+            with _TODO_WRITE_LOCK:
+                _TODO_WRITE_ERRORS[filepath] = e
+        else:
+            with _TODO_WRITE_LOCK:
+                _TODO_WRITE_ERRORS.pop(filepath, None)
+
+
+def _queue_todo_write(filepath: Path, data: bytes) -> None:
+    """Queue a todo file write on the background writer thread."""
+    global _TODO_WRITE_FUTURE, _TODO_WRITE_EXECUTOR
+    with _TODO_WRITE_LOCK:
+        _TODO_WRITES[filepath] = data
+        if _TODO_WRITE_FUTURE is None:
+            if _TODO_WRITE_EXECUTOR is None:
+                _TODO_WRITE_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="agend-todo-writer"
+                )
+            _TODO_WRITE_FUTURE = _TODO_WRITE_EXECUTOR.submit(_drain_todo_writes)
+
+
+def wait_for_todo_writes(filepath: Optional[Path] = None) -> None:
+    """
+    Block until all queued todo file writes have finished.
+
+    Args:
+        filepath: Only raise a failed background write of this file. If
+            None, raise the first failure of any file; the others are kept
+            for later calls.
+
+    Raises:
+        OSError: If a background write (of filepath) failed.
+    """
+    with _TODO_WRITE_LOCK:
+        future = _TODO_WRITE_FUTURE
+    if future is not None:
+        future.result()
+    with _TODO_WRITE_LOCK:
+        if filepath is not None:
+            error = _TODO_WRITE_ERRORS.pop(filepath, None)
+        elif _TODO_WRITE_ERRORS:
+            error = _TODO_WRITE_ERRORS.pop(next(iter(_TODO_WRITE_ERRORS)))
+        else:
+            error = None
+    if error is not None:
+        raise error
+
+
+def _finish_todo_writes() -> None:
+    """Wait for queued writes at exit and report any failures not yet raised."""
+    with _TODO_WRITE_LOCK:
+        future = _TODO_WRITE_FUTURE
+    if future is not None:
+        future.result()
+    with _TODO_WRITE_LOCK:
+        errors = list(_TODO_WRITE_ERRORS.items())
+        _TODO_WRITE_ERRORS.clear()
+    for filepath, error in errors:
+        print(f"agend: failed to write {filepath}: {error}", file=sys.stderr)
+
+
+atexit.register(_finish_todo_writes)
+
+# JSON inside a markdown code block (```json ... ``` or ``` ... ```)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE)
+
+# Characters that affect brace matching; everything else is skipped in C
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
+
+def _match_brace(text: str, start: int) -> int:
+    """Return the index of the ``}`` closing the ``{`` at start, or -1."""
+    depth = 0
+    in_string = False
+    escaped_until = -1
+    for match in _JSON_SCAN_RE.finditer(text, start):
+        i = match.start()
+        if i < escaped_until:
+            continue
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                escaped_until = i + 2
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _first_valid_span(text: str, spans: list[list[int]]) -> Optional[tuple[str, Any]]:
+    """Return the first span (by start position) that parses as JSON, with its value."""
+    for start, end in spans:
+        if end == -2:
+            # Opened inside what looked like a string: match it on its own
+            end = _match_brace(text, start)
+        if end < 0:
+            continue
+        candidate = text[start : end + 1]
+        try:
+            return candidate, _json.loads(candidate)
+        except _json.JSONDecodeError:
+            # Not valid JSON, try next start position
+            continue
+    return None
+
+
+def _find_json_object(text: str) -> Optional[tuple[str, Any]]:
+    """
+    Find the first valid JSON object in text by matching braces.
+
+    Braces inside JSON string literals are ignored. The text is scanned
+    once, jumping between structural characters only, and every ``{`` is
+    paired with its ``}`` via a stack; candidates are then tried in order
+    of their start position, as soon as their outermost object closes.
+
+    Args:
+        text: The text to search for JSON.
+
+    Returns:
+        A (JSON string, parsed value) tuple, or None if not found.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    # [start, end] per "{"; end is -1 while unclosed, -2 if seen in a string
+    spans: list[list[int]] = []
+    stack: list[int] = []
+    in_string = False
+    escaped_until = -1
+    for match in _JSON_SCAN_RE.finditer(text, start):
+        i = match.start()
+        if i < escaped_until:
+            continue
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                escaped_until = i + 2
+            elif c == '"':
+                in_string = False
+            elif c == "{":
+                spans.append([i, -2])
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            stack.append(len(spans))
+            spans.append([i, -1])
+        elif c == "}" and stack:
+            spans[stack.pop()][1] = i
+            if not stack:
+                # An outermost object closed: try it and everything inside it
+                found = _first_valid_span(text, spans)
+                if found is not None:
+                    return found
+                spans.clear()
+
+    return _first_valid_span(text, spans)
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Extract the first valid JSON object from text by matching braces.
+
+    Args:
+        text: The text to search for JSON.
+
+    Returns:
+        The extracted JSON string, or None if not found.
+    """
+    found = _find_json_object(text)
+    return found[0] if found is not None else None
+
+
+def _item_text(content) -> str:
+    """
+    Todo item content as text.
+
+    Supervisor JSON sometimes has objects or lists instead of strings among
+    its items; those are kept as their JSON text so they can be indexed.
+    """
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, ensure_ascii=False)
 
 
 class TaskStatus(str, Enum):
@@ -25,7 +262,11 @@ class TaskStatus(str, Enum):
     PENDING = "pending"
 
 
-@dataclass
+# Status string -> TaskStatus, for lookups without raising on unknown values
+_STATUS_MAP: dict[str, TaskStatus] = {status.value: status for status in TaskStatus}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TodoItem:
     """A single todo item with completion status."""
 
@@ -36,12 +277,26 @@ class TodoItem:
         return {"content": self.content, "completed": self.completed}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TodoList:
     """Todo list that can be persisted to a file."""
 
     items: list[TodoItem] = field(default_factory=list)
     task_description: str = ""
+    # Cached get_completed_items_text() result; reset by add_item/mark_completed
+    _completed_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Whether there are changes not yet written to _saved_path
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _saved_path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    # content -> first item with that content, kept in sync by add_item
+    _by_content: dict[str, TodoItem] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for item in self.items:
+            item.content = _item_text(item.content)
+            self._by_content.setdefault(item.content, item)
 
     def to_dict(self) -> dict:
         return {
@@ -57,6 +312,12 @@ class TodoList:
         ]
         return cls(items=items, task_description=data.get("task_description", ""))
 
+    def set_task_description(self, task_description: str) -> None:
+        """Set the task description, marking the list as changed if it differs."""
+        if task_description != self.task_description:
+            self.task_description = task_description
+            self._dirty = True
+
     def get_pending_items(self) -> list[str]:
         """Return list of pending (not completed) item contents."""
         return [item.content for item in self.items if not item.completed]
@@ -65,35 +326,134 @@ class TodoList:
         """Return list of completed item contents."""
         return [item.content for item in self.items if item.completed]
 
+    def get_completed_items_text(self) -> str:
+        """
+        Return completed items as a markdown checklist ("" if none).
+
+        The text is cached until the list is changed via add_item() or
+        mark_completed().
+        """
+        if self._completed_text is None:
+            self._completed_text = "\n".join(
+                f"- ✅ {item.content}" for item in self.items if item.completed
+            )
+        return self._completed_text
+
     def mark_completed(self, item_content: str) -> bool:
         """Mark an item as completed by content. Returns True if found."""
-        for item in self.items:
-            if item.content == item_content:
-                item.completed = True
-                return True
-        return False
+        item = self._by_content.get(_item_text(item_content))
+        if item is None:
+            return False
+        if not item.completed:
+            item.completed = True
+            self._completed_text = None
+            self._dirty = True
+        return True
 
     def add_item(self, content: str, completed: bool = False) -> None:
         """Add a new item if it doesn't already exist."""
-        if not any(item.content == content for item in self.items):
-            self.items.append(TodoItem(content=content, completed=completed))
+        content = _item_text(content)
+        if content in self._by_content:
+            return
+        item = TodoItem(content=content, completed=completed)
+        self.items.append(item)
+        self._by_content[content] = item
+        self._dirty = True
+        if completed:
+            self._completed_text = None
+
+    def add_items_bulk(self, contents: Iterable[str], completed: bool = False) -> int:
+        """
+        Add several items in one pass, skipping ones that already exist.
+
+        Args:
+            contents: Item contents to add (duplicates are ignored).
+            completed: Completion status for the new items.
+
+        Returns:
+            The number of items actually added.
+        """
+        by_content = self._by_content
+        added = 0
+        for content in map(_item_text, contents):
+            if content not in by_content:
+                item = TodoItem(content=content, completed=completed)
+                self.items.append(item)
+                by_content[content] = item
+                added += 1
+        if added:
+            self._dirty = True
+            if completed:
+                self._completed_text = None
+        return added
 
     def save(self, filepath: Path) -> None:
-        """Save todo list to JSON file."""
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        """
+        Save todo list to JSON file.
+
+        The file is written to a temporary sibling and moved into place, so
+        readers never see a half-written file. Saving is skipped when the
+        list has not changed since it was last loaded from or saved to the
+        same path (changes made via add_item, mark_completed and
+        set_task_description are tracked).
+        """
+        if not self._dirty and self._saved_path == filepath:
+            return
+
+        # An older queued background write must not land after this one
+        wait_for_todo_writes(filepath)
+        _write_todo_file(filepath, _json.dumps_indented(self.to_dict()))
+
+        self._dirty = False
+        self._saved_path = filepath
+
+    def save_in_background(self, filepath: Path) -> None:
+        """
+        Like save(), but hand the file write to a background writer thread.
+
+        The list is serialized immediately, so later changes are not picked
+        up by this save. Load the file (or call wait_for_todo_writes()) to
+        make sure the write has finished.
+        """
+        if not self._dirty and self._saved_path == filepath:
+            return
+
+        _queue_todo_write(filepath, _json.dumps_indented(self.to_dict()))
+
+        self._dirty = False
+        self._saved_path = filepath
 
     @classmethod
     def load(cls, filepath: Path) -> "TodoList":
-        """Load todo list from JSON file. Returns empty list if file doesn't exist."""
-        if not filepath.exists():
+        """
+        Load todo list from JSON file. Returns empty list if file doesn't exist.
+
+        The parsed file is cached while its mtime and size are unchanged;
+        every call still returns a fresh, independent TodoList. Pending
+        background writes are waited for first.
+        """
+        wait_for_todo_writes(filepath)
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
             return cls()
-        with open(filepath, "r", encoding="utf-8") as f:
-            return cls.from_dict(json.load(f))
+
+        key = str(filepath)
+        cached = _TODO_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            data = cached[2]
+        else:
+            data = _json.loads(filepath.read_bytes())
+            _TODO_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+
+        # from_dict builds new items, so the cached data is never mutated
+        todo_list = cls.from_dict(data)
+        todo_list._dirty = False
+        todo_list._saved_path = filepath
+        return todo_list
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SupervisorResult:
     """Result from supervisor agent evaluation."""
 
@@ -119,8 +479,7 @@ class SupervisorResult:
     def save_to_file(self, filepath: Path) -> None:
         """Save result to a JSON file."""
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        filepath.write_bytes(_json.dumps_indented(self.to_dict()))
 
     @classmethod
     def load_from_file(cls, filepath: Path) -> Optional["SupervisorResult"]:
@@ -128,8 +487,7 @@ class SupervisorResult:
         if not filepath.exists():
             return None
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json.loads(filepath.read_bytes())
             return cls(
                 is_complete=data.get("is_complete", False),
                 status=TaskStatus(data.get("status", "pending")),
@@ -138,7 +496,7 @@ class SupervisorResult:
                 newly_completed=data.get("newly_completed", []),
                 iteration=data.get("iteration", 0),
             )
-        except (json.JSONDecodeError, ValueError):
+        except (_json.JSONDecodeError, ValueError):
             return None
 
 
@@ -178,6 +536,37 @@ class SupervisorAgent:
 - 如果任务未完成，设置 is_complete 为 false，并列出所有未完成的具体项目
 - newly_completed 应列出相比上次检查新完成的项目
 - summary 应简明扼要地描述当前进度
+"""
+
+    # Prompt template for checking several checkpoints in one agent call
+    BATCH_CHECK_PROMPT = """请依次检查以下任务在多个检查点的完成情况。
+
+## 原始任务
+{task}
+
+## 已完成的项目
+{completed_items}
+
+## 检查点
+{checkpoints}
+
+请按照以下JSON格式回复（只返回JSON，不要有其他内容），results 按检查点顺序为每个检查点给出一项：
+{{
+    "results": [
+        {{
+            "is_complete": true/false,
+            "status": "completed" | "in_progress" | "pending",
+            "pending_items": ["未完成项1", "未完成项2", ...],
+            "newly_completed": ["本次新完成的项1", ...],
+            "summary": "该检查点状态的简要总结"
+        }}
+    ]
+}}
+
+注意：
+- results 的数量必须与检查点数量一致
+- 最后一个检查点反映任务的当前状态
+- 每项的字段含义与单次检查相同：已全部完成时 is_complete 为 true 且 pending_items 为空数组
 """
 
     def __init__(
@@ -208,6 +597,8 @@ class SupervisorAgent:
         self.todo_file = Path(todo_file) if todo_file else Path(".agend/todo.json")
         self.results_dir = Path(results_dir) if results_dir else Path(".agend/results")
         self._todo_list: Optional[TodoList] = None
+        # (template, task, completed text, context) -> prompt of the last check
+        self._last_prompt_cache: Optional[tuple[tuple[str, str, str, str], str]] = None
 
     @property
     def todo_list(self) -> TodoList:
@@ -219,7 +610,8 @@ class SupervisorAgent:
     def _save_todo_list(self) -> None:
         """Save the current todo list to file."""
         if self._todo_list is not None:
-            self._todo_list.save(self.todo_file)
+            # Written off the critical path; TodoList.load waits for it
+            self._todo_list.save_in_background(self.todo_file)
 
     def get_result_file_path(self, iteration: int) -> Path:
         """Get the file path for a specific iteration's result."""
@@ -237,6 +629,46 @@ class SupervisorAgent:
         
         return SupervisorResult.load_from_file(result_files[0])
 
+    def _build_check_prompt(self, task: str, context: str) -> str:
+        """Record the task on the todo list and build the status-check prompt."""
+        # Update task description in todo list
+        self.todo_list.set_task_description(task)
+
+        # Format completed items for the prompt (cached by the todo list)
+        completed_str = self.todo_list.get_completed_items_text() or "（暂无已完成项目）"
+
+        # Reuse the last prompt when nothing it depends on has changed
+        key = (self.check_prompt_template, task, completed_str, context)
+        if self._last_prompt_cache is not None and self._last_prompt_cache[0] == key:
+            return self._last_prompt_cache[1]
+
+        # Build the prompt
+        prompt = self.check_prompt_template.format(
+            task=task,
+            completed_items=completed_str,
+            context=context if context else "这是首次检查，暂无历史上下文。",
+        )
+        self._last_prompt_cache = (key, prompt)
+        return prompt
+
+    def _finish_check(
+        self, response: AgentResponse, iteration: int, save_to_file: bool
+    ) -> SupervisorResult:
+        """Parse a status-check response, update the todo list and persist the result."""
+        # Parse the response and update todo list
+        result = self._parse_response(response)
+        result.iteration = iteration
+
+        # Update todo list with newly completed and pending items
+        self._update_todo_list(result)
+
+        # Save result to file if requested
+        if save_to_file:
+            result_file = self.get_result_file_path(iteration)
+            result.save_to_file(result_file)
+
+        return result
+
     def check_completion(
         self,
         task: str,
@@ -262,42 +694,129 @@ class SupervisorAgent:
         Returns:
             SupervisorResult indicating completion status and pending items.
         """
-        # Update task description in todo list
-        self.todo_list.task_description = task
+        prompt = self._build_check_prompt(task, context)
 
-        # Format completed items for the prompt
-        completed_items = self.todo_list.get_completed_items()
-        if completed_items:
-            completed_str = "\n".join(f"- ✅ {item}" for item in completed_items)
-        else:
-            completed_str = "（暂无已完成项目）"
+        # Use provided callback or instance callback
+        output_callback = on_output or self.on_output
 
-        # Build the prompt
-        prompt = self.check_prompt_template.format(
-            task=task,
-            completed_items=completed_str,
-            context=context if context else "这是首次检查，暂无历史上下文。",
-        )
+        # Execute via agent CLI
+        response = self.agent_cli.execute(prompt, on_output=output_callback)
+
+        return self._finish_check(response, iteration, save_to_file)
+
+    async def acheck_completion(
+        self,
+        task: str,
+        context: str = "",
+        on_output: Optional[Callable[[str], None]] = None,
+        iteration: int = 0,
+        save_to_file: bool = True,
+    ) -> SupervisorResult:
+        """
+        Asynchronous variant of check_completion().
+
+        Awaits the agent via AgentCLI.aexecute() so the caller's event loop
+        stays free while the agent runs. Arguments and result are the same
+        as for check_completion().
+        """
+        prompt = self._build_check_prompt(task, context)
 
         # Use provided callback or instance callback
         output_callback = on_output or self.on_output
 
         # Execute via agent CLI
-        response = self.agent_cli.execute(prompt, on_output=output_callback)
+        response = await self.agent_cli.aexecute(prompt, on_output=output_callback)
 
-        # Parse the response and update todo list
-        result = self._parse_response(response)
-        result.iteration = iteration
+        return self._finish_check(response, iteration, save_to_file)
 
-        # Update todo list with newly completed and pending items
-        self._update_todo_list(result)
+    def _build_batch_prompt(self, task: str, contexts: list[str]) -> str:
+        """Build the prompt that checks several checkpoints at once."""
+        self.todo_list.set_task_description(task)
+        completed_str = self.todo_list.get_completed_items_text() or "（暂无已完成项目）"
+        checkpoints = "\n\n".join(
+            f"### 检查点 {k}\n{context or '这是首次检查，暂无历史上下文。'}"
+            for k, context in enumerate(contexts, 1)
+        )
+        return self.BATCH_CHECK_PROMPT.format(
+            task=task,
+            completed_items=completed_str,
+            checkpoints=checkpoints,
+        )
 
-        # Save result to file if requested
-        if save_to_file:
-            result_file = self.get_result_file_path(iteration)
-            result.save_to_file(result_file)
+    def _parse_batch_response(
+        self, response: AgentResponse, count: int
+    ) -> list[SupervisorResult]:
+        """Parse a batched status-check response into one result per checkpoint."""
+        if not response.success:
+            return [self._failed_result(response) for _ in range(count)]
+
+        data = self._extract_response_data(response.output)
+        entries = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            entries = []
+
+        return [
+            self._result_from_data(entries[k], response.output)
+            if k < len(entries) and isinstance(entries[k], dict)
+            else self._unparsable_result(response)
+            for k in range(count)
+        ]
 
-        return result
+    def _finish_batch(
+        self,
+        response: AgentResponse,
+        count: int,
+        iterations: Optional[list[int]],
+        save_to_file: bool,
+    ) -> list[SupervisorResult]:
+        """Parse a batched response, update the todo list and persist each result."""
+        results = self._parse_batch_response(response, count)
+        for k, result in enumerate(results):
+            result.iteration = iterations[k] if iterations else 0
+            self._update_todo_list(result)
+            if save_to_file:
+                result.save_to_file(self.get_result_file_path(result.iteration))
+        return results
+
+    def check_completion_batch(
+        self,
+        task: str,
+        contexts: list[str],
+        on_output: Optional[Callable[[str], None]] = None,
+        iterations: Optional[list[int]] = None,
+        save_to_file: bool = True,
+    ) -> list[SupervisorResult]:
+        """
+        Check several checkpoints of the task with a single agent call.
+
+        Used to amortize supervisor calls over several worker iterations.
+
+        Args:
+            task: The original task description.
+            contexts: Context for each checkpoint, oldest first.
+            on_output: Optional callback for real-time output (overrides instance callback).
+            iterations: Iteration number of each checkpoint (used for file naming).
+            save_to_file: Whether to save each result to a JSON file.
+
+        Returns:
+            One SupervisorResult per context, in the same order.
+        """
+        prompt = self._build_batch_prompt(task, contexts)
+        response = self.agent_cli.execute(prompt, on_output=on_output or self.on_output)
+        return self._finish_batch(response, len(contexts), iterations, save_to_file)
+
+    async def acheck_completion_batch(
+        self,
+        task: str,
+        contexts: list[str],
+        on_output: Optional[Callable[[str], None]] = None,
+        iterations: Optional[list[int]] = None,
+        save_to_file: bool = True,
+    ) -> list[SupervisorResult]:
+        """Asynchronous variant of check_completion_batch()."""
+        prompt = self._build_batch_prompt(task, contexts)
+        response = await self.agent_cli.aexecute(prompt, on_output=on_output or self.on_output)
+        return self._finish_batch(response, len(contexts), iterations, save_to_file)
 
     def _update_todo_list(self, result: SupervisorResult) -> None:
         """
@@ -306,13 +825,11 @@ class SupervisorAgent:
         Marks newly completed items and adds any new pending items.
         """
         # Mark newly completed items
-        newly_completed = getattr(result, "newly_completed", [])
-        for item in newly_completed:
+        for item in result.newly_completed:
             self.todo_list.mark_completed(item)
 
         # Add any new pending items that aren't already in the list
-        for item in result.pending_items:
-            self.todo_list.add_item(item, completed=False)
+        self.todo_list.add_items_bulk(result.pending_items)
 
         # Save the updated todo list
         self._save_todo_list()
@@ -327,115 +844,107 @@ class SupervisorAgent:
         Returns:
             The extracted JSON string, or None if not found.
         """
-        # Find all positions of opening braces
-        start_positions = [i for i, c in enumerate(text) if c == "{"]
-
-        for start in start_positions:
-            # Try to find matching closing brace
-            brace_count = 0
-            for i in range(start, len(text)):
-                if text[i] == "{":
-                    brace_count += 1
-                elif text[i] == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        # Found a potential JSON object
-                        json_str = text[start : i + 1]
-                        try:
-                            json.loads(json_str)
-                            return json_str
-                        except json.JSONDecodeError:
-                            # Not valid JSON, try next start position
-                            break
-        return None
+        return _extract_json_object(text)
 
-    def _parse_response(self, response: AgentResponse) -> SupervisorResult:
+    def _extract_response_data(self, output: str):
         """
-        Parse the agent response into a SupervisorResult.
+        Find and parse the JSON payload in an agent's output.
 
         Args:
-            response: The raw agent response.
+            output: The agent output text.
 
         Returns:
-            Parsed SupervisorResult.
+            The parsed JSON value, or None if no valid JSON was found.
         """
-        if not response.success:
-            return SupervisorResult(
-                is_complete=False,
-                status=TaskStatus.PENDING,
-                pending_items=[f"Agent执行失败: {response.error}"],
-                summary="无法检查任务状态，agent执行出错",
-                raw_response=response.output,
-            )
-
-        output = response.output
-        json_str = None
+        # Fast path: the agent returned bare JSON, as the prompt asks
+        stripped = output.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
+            try:
+                return _json.loads(stripped)
+            except _json.JSONDecodeError:
+                pass
 
         # Strategy 1: Try to find JSON in markdown code blocks (case-insensitive)
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", output, re.IGNORECASE)
+        json_match = _JSON_FENCE_RE.search(output)
         if json_match:
-            candidate = json_match.group(1).strip()
             try:
-                json.loads(candidate)
-                json_str = candidate
-            except json.JSONDecodeError:
+                return _json.loads(json_match.group(1).strip())
+            except _json.JSONDecodeError:
                 pass
 
-        # Strategy 2: Try to extract JSON by finding balanced braces
-        if json_str is None:
-            json_str = self._extract_json_from_text(output)
+        # Strategy 2: Try to extract JSON by finding balanced braces; the
+        # scan already parsed the match, so reuse that value
+        found = _find_json_object(output)
+        if found is not None:
+            return found[1]
 
         # Strategy 3: Try the entire output as JSON
-        if json_str is None:
-            try:
-                json.loads(output.strip())
-                json_str = output.strip()
-            except json.JSONDecodeError:
-                pass
+        try:
+            return _json.loads(stripped)
+        except _json.JSONDecodeError:
+            return None
 
-        if json_str is None:
-            # Could not find valid JSON
-            return SupervisorResult(
-                is_complete=False,
-                status=TaskStatus.PENDING,
-                pending_items=["无法解析agent响应，请手动检查"],
-                summary=response.output[:200] if response.output else "无输出",
-                raw_response=response.output,
-            )
+    @staticmethod
+    def _failed_result(response: AgentResponse) -> SupervisorResult:
+        """Result for an agent execution that failed."""
+        return SupervisorResult(
+            is_complete=False,
+            status=TaskStatus.PENDING,
+            pending_items=[f"Agent执行失败: {response.error}"],
+            summary="无法检查任务状态，agent执行出错",
+            raw_response=response.output,
+        )
 
-        try:
-            data = json.loads(json_str)
+    @staticmethod
+    def _unparsable_result(response: AgentResponse) -> SupervisorResult:
+        """Result for an agent response without usable JSON."""
+        return SupervisorResult(
+            is_complete=False,
+            status=TaskStatus.PENDING,
+            pending_items=["无法解析agent响应，请手动检查"],
+            summary=response.output[:200] if response.output else "无输出",
+            raw_response=response.output,
+        )
 
-            is_complete = data.get("is_complete", False)
-            status_str = data.get("status", "pending")
-            pending_items = data.get("pending_items", [])
-            newly_completed = data.get("newly_completed", [])
-            summary = data.get("summary", "")
+    @staticmethod
+    def _result_from_data(data: dict, output: str) -> SupervisorResult:
+        """Build a SupervisorResult from a parsed status object."""
+        status_str = data.get("status", "pending")
+        # Convert status string to enum (unknown values count as pending)
+        status = (
+            _STATUS_MAP.get(status_str, TaskStatus.PENDING)
+            if isinstance(status_str, str)
+            else TaskStatus.PENDING
+        )
 
-            # Convert status string to enum
-            try:
-                status = TaskStatus(status_str)
-            except ValueError:
-                status = TaskStatus.PENDING
-
-            return SupervisorResult(
-                is_complete=is_complete,
-                status=status,
-                pending_items=pending_items,
-                summary=summary,
-                raw_response=output,
-                newly_completed=newly_completed,
-            )
+        return SupervisorResult(
+            is_complete=data.get("is_complete", False),
+            status=status,
+            pending_items=data.get("pending_items", []),
+            summary=data.get("summary", ""),
+            raw_response=output,
+            newly_completed=data.get("newly_completed", []),
+        )
 
-        except json.JSONDecodeError:
-            # If we can't parse JSON, treat as incomplete and use the raw output
-            return SupervisorResult(
-                is_complete=False,
-                status=TaskStatus.PENDING,
-                pending_items=["无法解析agent响应，请手动检查"],
-                summary=response.output[:200] if response.output else "无输出",
-                raw_response=response.output,
-            )
+    def _parse_response(self, response: AgentResponse) -> SupervisorResult:
+        """
+        Parse the agent response into a SupervisorResult.
+
+        Args:
+            response: The raw agent response.
+
+        Returns:
+            Parsed SupervisorResult.
+        """
+        if not response.success:
+            return self._failed_result(response)
+
+        data = self._extract_response_data(response.output)
+        if data is None:
+            # Could not find valid JSON
+            return self._unparsable_result(response)
+
+        return self._result_from_data(data, response.output)
 
     def generate_pending_document(self, result: SupervisorResult, task: str) -> str:
         """
@@ -448,29 +957,28 @@ class SupervisorAgent:
         Returns:
             A formatted document describing what's pending.
         """
-        lines = [
+        parts = [
             "# 任务完成状态报告",
             "",
-            f"## 原始任务",
+            "## 原始任务",
             task,
             "",
             f"## 当前状态: {result.status.value}",
             "",
-            f"## 摘要",
+            "## 摘要",
             result.summary,
             "",
         ]
 
         if result.pending_items:
-            lines.append("## 待完成项目")
-            lines.append("")
-            for i, item in enumerate(result.pending_items, 1):
-                lines.append(f"{i}. {item}")
-            lines.append("")
-
-        if result.is_complete:
-            lines.append("✅ 所有任务已完成！")
-        else:
-            lines.append("⏳ 任务仍在进行中，请继续处理上述待完成项目。")
+            parts += ("## 待完成项目", "")
+            parts.extend(f"{i}. {item}" for i, item in enumerate(result.pending_items, 1))
+            parts.append("")
+
+        parts.append(
+            "✅ 所有任务已完成！"
+            if result.is_complete
+            else "⏳ 任务仍在进行中，请继续处理上述待完成项目。"
+        )
 
-        return "\n".join(lines)
+        return "\n".join(parts)
@@ -8,23 +8,33 @@ Coordinates the iterative process of:
 4. Repeat until complete or max iterations reached
 """
 
+import asyncio
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Callable, Optional, Union
 
-from agend.agent_cli import AgentCLI, AgentType
-from agend.supervisor import SupervisorAgent, SupervisorResult
+from agend import _json
+from agend.agent_cli import _DATACLASS_SLOTS, AgentCLI, AgentType
+from agend.supervisor import SupervisorAgent, SupervisorResult, TaskStatus
 from agend.worker import WorkerAgent, WorkerResult
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IterationLog:
-    """Log entry for a single iteration."""
+    """
+    Log entry for a single iteration.
+
+    timestamp is the iteration's start time as a time.time() value; to_dict()
+    renders it as a local ISO 8601 string.
+    """
 
     iteration: int
-    timestamp: str
+    timestamp: float
     worker_result: Optional[WorkerResult] = None
     supervisor_result: Optional[SupervisorResult] = None
 
@@ -32,15 +42,19 @@ class IterationLog:
         """Convert to dictionary."""
         return {
             "iteration": self.iteration,
-            "timestamp": self.timestamp,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
             "worker_result": self.worker_result.to_dict() if self.worker_result else None,
             "supervisor_result": (
                 self.supervisor_result.to_dict() if self.supervisor_result else None
             ),
         }
 
+    def to_json(self) -> bytes:
+        """Convert to compact UTF-8 encoded JSON (uses orjson when installed)."""
+        return _json.dumps_compact(self.to_dict())
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaskRunResult:
     """Result from running a complete task."""
 
@@ -66,6 +80,154 @@ class TaskRunResult:
             "error": self.error,
         }
 
+    def to_columnar(self) -> dict[str, list]:
+        """
+        Convert the iteration logs to columns, one list per field.
+
+        Convenient for scanning iterations (e.g. which ones failed) or loading
+        into a DataFrame. Values are None where an iteration has no worker or
+        supervisor result.
+        """
+        columns: dict[str, list] = {
+            "iteration": [],
+            "timestamp": [],
+            "worker_success": [],
+            "worker_output": [],
+            "worker_error": [],
+            "supervisor_complete": [],
+            "supervisor_summary": [],
+            "pending_counts": [],
+        }
+        for log in self.logs:
+            worker = log.worker_result
+            supervisor = log.supervisor_result
+            columns["iteration"].append(log.iteration)
+            columns["timestamp"].append(datetime.fromtimestamp(log.timestamp).isoformat())
+            columns["worker_success"].append(worker.success if worker else None)
+            columns["worker_output"].append(worker.output if worker else None)
+            columns["worker_error"].append(worker.error if worker else None)
+            columns["supervisor_complete"].append(supervisor.is_complete if supervisor else None)
+            columns["supervisor_summary"].append(supervisor.summary if supervisor else None)
+            columns["pending_counts"].append(len(supervisor.pending_items) if supervisor else None)
+        return columns
+
+    def to_json(self) -> bytes:
+        """Convert to compact UTF-8 encoded JSON (uses orjson when installed)."""
+        return _json.dumps_compact(self.to_dict())
+
+
+class _IterationLogs:
+    """
+    Iteration logs of a run, optionally streamed to a JSON Lines file.
+
+    Without a log file every log is kept in memory. With one, each log is
+    appended to the file as a line once it is final and only the last
+    KEEP_IN_MEMORY logs stay in memory.
+    """
+
+    KEEP_IN_MEMORY = 3
+
+    def __init__(self, log_path: Optional[Path] = None):
+        self._logs: Union[list[IterationLog], deque[IterationLog]]
+        self._file = None
+        # Logs not yet written, because their supervisor check is deferred
+        self._unwritten: list[IterationLog] = []
+        if log_path is None:
+            self._logs = []
+        else:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(log_path, "ab")
+            self._logs = deque(maxlen=self.KEEP_IN_MEMORY)
+
+    def append(self, log: IterationLog, hold: bool = False) -> None:
+        """
+        Record a finished iteration.
+
+        Args:
+            log: The iteration log.
+            hold: Delay writing (this and earlier held logs) until a later
+                  append or close(), e.g. while supervisor results are pending.
+        """
+        self._logs.append(log)
+        if self._file is not None:
+            self._unwritten.append(log)
+            if not hold:
+                self._write_unwritten()
+
+    def _write_unwritten(self) -> None:
+        for log in self._unwritten:
+            self._file.write(log.to_json() + b"\n")
+        self._file.flush()
+        self._unwritten.clear()
+
+    def to_list(self) -> list[IterationLog]:
+        """Logs kept in memory, oldest first."""
+        return list(self._logs)
+
+    def close(self) -> None:
+        """Write any held logs and close the log file."""
+        if self._file is not None:
+            self._write_unwritten()
+            self._file.close()
+            self._file = None
+
+
+class _ChunkedCallback:
+    """
+    Output callback wrapper that forwards streamed text in chunks.
+
+    Text is buffered and passed to the wrapped callback as one string once
+    max_chars characters accumulate or max_delay_s seconds after the first
+    buffered piece (a timer flushes it), so chatty agents cause a few
+    callback invocations instead of one per line.
+
+    Threading: the wrapped callback may be invoked from the timer's thread
+    as well as from the threads calling this object or flush(). Every
+    invocation happens while holding the internal lock, so calls never
+    overlap and text is delivered in the order it was received.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str], None],
+        max_chars: int = 8192,
+        max_delay_s: float = 0.05,
+    ):
+        self._callback = callback
+        self._max_chars = max_chars
+        self._max_delay_s = max_delay_s
+        self._buf: list[str] = []
+        self._size = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> None:
+        with self._lock:
+            self._buf.append(text)
+            self._size += len(text)
+            if self._size >= self._max_chars:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._max_delay_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Forward any buffered text now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        # Callers hold self._lock, which also serializes the callback invocations
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            text = "".join(self._buf)
+            self._buf.clear()
+            self._size = 0
+            self._callback(text)
+
 
 class TaskRunner:
     """
@@ -91,6 +253,9 @@ class TaskRunner:
         results_dir: Optional[str] = None,
         start_iteration: int = 1,
         initial_pending_items: Optional[list[str]] = None,
+        batch_supervisor_every: int = 1,
+        trust_worker_completion: bool = False,
+        log_path: Optional[str] = None,
     ):
         """
         Initialize the task runner.
@@ -99,7 +264,8 @@ class TaskRunner:
             agent_type: The type of agent to use for both supervisor and worker.
             model: The model name to use.
             max_iterations: Maximum number of worker iterations before stopping.
-            delay_between_iterations: Delay in seconds between iterations.
+            delay_between_iterations: Minimum delay in seconds between the starts of
+                     consecutive iterations (time already spent iterating counts).
             chat_id: Optional chat ID to resume an existing conversation.
                      If provided, skip creating a new chat session.
             supervisor_agent: Optional pre-configured supervisor agent.
@@ -107,9 +273,20 @@ class TaskRunner:
             on_iteration_complete: Optional callback after each iteration.
             on_status_update: Optional callback for status updates.
             on_agent_output: Optional callback for real-time agent output streaming.
+                     Output is delivered in chunks of one or more lines, possibly
+                     from a timer thread (calls never overlap), unless the
+                     callback has its own flush() (i.e. already buffers).
             results_dir: Optional directory for storing iteration results. If None, uses ".agend/results".
             start_iteration: Starting iteration number (for continue mode). Defaults to 1.
             initial_pending_items: Initial pending items from previous run (for continue mode).
+            batch_supervisor_every: Check completion once every N iterations, covering
+                     the skipped iterations in the same supervisor call. Defaults to 1
+                     (check after every iteration).
+            trust_worker_completion: Ask the worker to mark its output when it considers
+                     the task done, and accept that as completion without a supervisor
+                     check. Defaults to False.
+            log_path: Optional JSON Lines file that each iteration log is appended to.
+                     When set, TaskRunResult.logs only holds the last few iterations.
         """
         self.agent_type = agent_type
         self.model = model
@@ -119,6 +296,9 @@ class TaskRunner:
         self.results_dir = results_dir or ".agend/results"
         self.start_iteration = start_iteration
         self.initial_pending_items = initial_pending_items or []
+        self.batch_supervisor_every = max(1, batch_supervisor_every)
+        self.trust_worker_completion = trust_worker_completion
+        self.log_path = Path(log_path) if log_path else None
 
         # Store provided agents (may be None)
         self._provided_supervisor = supervisor_agent
@@ -130,16 +310,40 @@ class TaskRunner:
 
         self.on_iteration_complete = on_iteration_complete
         self.on_status_update = on_status_update
+        # Batch streamed output into chunks unless the callback already buffers
+        if on_agent_output is not None and not hasattr(on_agent_output, "flush"):
+            on_agent_output = _ChunkedCallback(on_agent_output)
         self.on_agent_output = on_agent_output
 
         # Worker agent CLI instance (with chat_id)
         self._worker_agent_cli: Optional[AgentCLI] = None
 
+        # Set by cancel() to stop the running task before its next iteration
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Stop the running task before its next iteration.
+
+        Returns immediately; a wait between iterations is cut short, while an
+        agent call that is already running finishes first, as do supervisor
+        checks still queued by batch_supervisor_every. Safe to call from any
+        thread.
+        """
+        self._cancel_event.set()
+
     def _log_status(self, message: str) -> None:
         """Log a status update."""
         if self.on_status_update:
+            # Deliver pending agent output first so the two stay in order
+            self._flush_agent_output()
             self.on_status_update(message)
 
+    def _flush_agent_output(self) -> None:
+        """Flush agent output buffered by the on_agent_output callback."""
+        if isinstance(self.on_agent_output, _ChunkedCallback):
+            self.on_agent_output.flush()
+
     def _initialize_agents(self) -> str:
         """
         Initialize agent CLIs for worker and supervisor.
@@ -191,15 +395,176 @@ class TaskRunner:
             self._provided_worker.agent_cli = worker_agent_cli
             self._provided_worker.results_dir = Path(self.results_dir)
 
+        if self.trust_worker_completion:
+            self.worker.report_completion = True
+
         # Store worker's agent CLI for reference
         self._worker_agent_cli = worker_agent_cli
 
         return chat_id
 
+    def _worker_completion_result(self, iteration: int) -> SupervisorResult:
+        """
+        Build and save the result for an iteration the worker reported as complete.
+
+        Stands in for the supervisor check, so continue mode finds a result
+        file for the iteration as usual.
+        """
+        result = SupervisorResult(
+            is_complete=True,
+            status=TaskStatus.COMPLETED,
+            pending_items=[],
+            summary="Worker报告任务已完成",
+            iteration=iteration,
+        )
+        result.save_to_file(self.supervisor.get_result_file_path(iteration))
+        return result
+
+    def _close_agents(self) -> None:
+        """Release the worker and supervisor agent CLIs once a run ends."""
+        for agent in (self.worker, self.supervisor):
+            if agent is not None:
+                agent.agent_cli.close()
+
+    async def _acheck_completion(
+        self,
+        task: str,
+        context: str,
+        iteration: int,
+        log: IterationLog,
+        deferred_checks: list[tuple[int, IterationLog, str]],
+        is_last_iteration: bool,
+    ) -> Optional[SupervisorResult]:
+        """
+        Run (or defer) the supervisor check for an iteration.
+
+        With batch_supervisor_every > 1, checks are queued in deferred_checks
+        and issued as one batched supervisor call every N iterations (and on
+        the last iteration); each queued log receives its own result.
+
+        Returns:
+            The result for this iteration, or None if the check was deferred.
+        """
+        if self.batch_supervisor_every == 1:
+            self._log_status("Supervisor正在检查任务完成状态...")
+            result = await self.supervisor.acheck_completion(
+                task, context, on_output=self.on_agent_output, iteration=iteration
+            )
+            log.supervisor_result = result
+            return result
+
+        deferred_checks.append((iteration, log, context))
+        if len(deferred_checks) < self.batch_supervisor_every and not is_last_iteration:
+            return None
+
+        results = await self._arun_deferred_checks(task, deferred_checks)
+        return results[-1]
+
+    async def _arun_deferred_checks(
+        self,
+        task: str,
+        deferred_checks: list[tuple[int, IterationLog, str]],
+    ) -> list[SupervisorResult]:
+        """
+        Run the queued supervisor checks as one batched call.
+
+        Each queued log receives its own result and deferred_checks is
+        emptied. Also used before a run ends early, so no iteration is left
+        without the check it was promised.
+
+        Returns:
+            The results, in the order the checks were queued.
+        """
+        self._log_status(f"Supervisor正在批量检查 {len(deferred_checks)} 轮的完成状态...")
+        batch = list(deferred_checks)
+        deferred_checks.clear()
+        results = await self.supervisor.acheck_completion_batch(
+            task,
+            [batch_context for _, _, batch_context in batch],
+            on_output=self.on_agent_output,
+            iterations=[batch_iteration for batch_iteration, _, _ in batch],
+        )
+        for (_, batch_log, _), result in zip(batch, results):
+            batch_log.supervisor_result = result
+        return results
+
     def run(self, task: str) -> TaskRunResult:
         """
         Run the task to completion.
 
+        Synchronous wrapper around arun(). When called from a thread that is
+        already running an event loop, arun() is driven on a fresh loop in a
+        helper thread instead.
+
+        Args:
+            task: The task description to execute.
+
+        Returns:
+            TaskRunResult with the outcome of the task run.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.arun(task))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.arun(task)).result()
+
+    @classmethod
+    def run_many(
+        cls,
+        tasks: list[str],
+        max_parallel: int = 4,
+        **runner_kwargs,
+    ) -> list[TaskRunResult]:
+        """
+        Run several independent tasks concurrently, one TaskRunner each.
+
+        At most max_parallel tasks run at the same time, so at most that many
+        agent CLI processes are active at once; lower it if the agent backend
+        rate-limits requests. Each task keeps its results and todo list in
+        its own "task_NNN" subdirectory of results_dir. Callbacks in
+        runner_kwargs are shared by all tasks and may be called from several
+        threads at once.
+
+        Args:
+            tasks: The task descriptions to execute.
+            max_parallel: Maximum number of tasks running at the same time.
+            **runner_kwargs: Arguments passed to every TaskRunner, except
+                     supervisor_agent and worker_agent, which can't be shared.
+
+        Returns:
+            The TaskRunResult of each task, in the order of tasks.
+        """
+        if "supervisor_agent" in runner_kwargs or "worker_agent" in runner_kwargs:
+            raise ValueError("run_many() cannot share supervisor_agent/worker_agent between tasks")
+
+        base_dir = Path(runner_kwargs.pop("results_dir", None) or ".agend/results")
+        runners = []
+        for index in range(len(tasks)):
+            task_dir = base_dir / f"task_{index + 1:03d}"
+            runner = cls(results_dir=str(task_dir), **runner_kwargs)
+            # Separate todo list per task, next to its results
+            runner._provided_supervisor = SupervisorAgent(
+                agent_type=runner.agent_type,
+                model=runner.model,
+                todo_file=str(task_dir / "todo.json"),
+                results_dir=str(task_dir),
+            )
+            runners.append(runner)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as executor:
+            futures = [executor.submit(runner.run, task) for runner, task in zip(runners, tasks)]
+            return [future.result() for future in futures]
+
+    async def arun(self, task: str) -> TaskRunResult:
+        """
+        Run the task to completion without blocking the event loop.
+
+        Agents are awaited through WorkerAgent.aexecute_task() and
+        SupervisorAgent.acheck_completion(), so several runners can share a
+        single event loop.
+
         Args:
             task: The task description to execute.
 
@@ -207,10 +572,14 @@ class TaskRunner:
             TaskRunResult with the outcome of the task run.
         """
         start_time = time.time()
-        logs: list[IterationLog] = []
+        self._cancel_event.clear()
         # Initialize pending items from previous run if in continue mode
         current_pending_items: list[str] = list(self.initial_pending_items)
+        # current_pending_items as a bullet list, shared by worker prompt and supervisor context
+        pending_bullets = WorkerAgent.format_pending_items(current_pending_items)
         chat_id: Optional[str] = None
+        # Iterations whose supervisor check waits for the next batch call
+        deferred_checks: list[tuple[int, IterationLog, str]] = []
 
         self._log_status(f"开始执行任务: {task[:100]}...")
 
@@ -220,7 +589,8 @@ class TaskRunner:
         else:
             self._log_status("创建会话...")
         try:
-            chat_id = self._initialize_agents()
+            # create_chat() is a blocking subprocess call
+            chat_id = await asyncio.to_thread(self._initialize_agents)
             if not self.chat_id:
                 self._log_status(f"会话创建成功, chat_id: {chat_id}")
         except Exception as e:
@@ -236,117 +606,192 @@ class TaskRunner:
                 error=f"Failed to create chat session: {e}",
             )
 
-        # Calculate end iteration based on start_iteration and max_iterations
-        end_iteration = self.start_iteration + self.max_iterations
-
-        for iteration in range(self.start_iteration, end_iteration):
-            timestamp = datetime.now().isoformat()
-            self._log_status(f"\n=== 第 {iteration} 轮迭代 ===")
-
-            # Create iteration log
-            log = IterationLog(iteration=iteration, timestamp=timestamp)
-
-            try:
-                # Step 1: Worker executes task
-                self._log_status("Worker正在执行任务...")
-
-                # First iteration of this run: check if we have pending items from continue mode
-                is_first_iteration_of_run = (iteration == self.start_iteration)
-                has_pending_items = bool(current_pending_items)
-
-                if is_first_iteration_of_run and not has_pending_items:
-                    # Fresh start: execute the original task
-                    worker_result = self.worker.execute_task(task, on_output=self.on_agent_output)
-                else:
-                    # Continue mode or subsequent iterations: include pending items
-                    worker_result = self.worker.execute_task(
-                        task, current_pending_items, on_output=self.on_agent_output
+        logs = _IterationLogs(self.log_path)
+        try:
+            # Calculate end iteration based on start_iteration and max_iterations
+            end_iteration = self.start_iteration + self.max_iterations
+
+            for iteration in range(self.start_iteration, end_iteration):
+                if self._cancel_event.is_set():
+                    if deferred_checks:
+                        await self._arun_deferred_checks(task, deferred_checks)
+                    self._log_status("⏹️ 任务已取消")
+                    return TaskRunResult(
+                        success=False,
+                        completed=False,
+                        iterations=iteration - 1,
+                        total_time=time.time() - start_time,
+                        chat_id=chat_id,
+                        logs=logs.to_list(),
+                        final_summary="任务已取消",
+                        error="Cancelled",
                     )
 
-                log.worker_result = worker_result
-
-                if not worker_result.success:
-                    self._log_status(f"Worker执行失败: {worker_result.error}")
-                    # Continue anyway to let supervisor check the state
-                else:
-                    self._log_status("Worker执行完成")
-
-                # Step 2: Supervisor checks completion
-                self._log_status("Supervisor正在检查任务完成状态...")
-
-                # Build context for supervisor
-                context = ""
-                if current_pending_items:
-                    context = "上一轮未完成项目:\n" + "\n".join(
-                        f"- {item}" for item in current_pending_items
+                iteration_start = time.time()
+                self._log_status(f"\n=== 第 {iteration} 轮迭代 ===")
+
+                # Create iteration log
+                log = IterationLog(iteration=iteration, timestamp=iteration_start)
+
+                try:
+                    # Step 1: Worker executes task
+                    self._log_status("Worker正在执行任务...")
+
+                    # First iteration of this run: check if we have pending items from continue mode
+                    is_first_iteration_of_run = (iteration == self.start_iteration)
+                    has_pending_items = bool(current_pending_items)
+
+                    if is_first_iteration_of_run and not has_pending_items:
+                        # Fresh start: execute the original task
+                        worker_result = await self.worker.aexecute_task(
+                            task, on_output=self.on_agent_output
+                        )
+                    else:
+                        # Continue mode or subsequent iterations: include pending items
+                        worker_result = await self.worker.aexecute_task(
+                            task,
+                            current_pending_items,
+                            on_output=self.on_agent_output,
+                            pending_bullets=pending_bullets,
+                        )
+
+                    log.worker_result = worker_result
+
+                    if not worker_result.success:
+                        self._log_status(f"Worker执行失败: {worker_result.error}")
+                        # Continue anyway to let supervisor check the state
+                    else:
+                        self._log_status("Worker执行完成")
+
+                    # Step 2: Supervisor checks completion (unless the worker reported it)
+                    if self.trust_worker_completion and worker_result.signaled_completion:
+                        self._log_status("Worker报告任务已完成，跳过Supervisor检查")
+                        # Earlier iterations still get their batched checks
+                        if deferred_checks:
+                            await self._arun_deferred_checks(task, deferred_checks)
+                        supervisor_result = self._worker_completion_result(iteration)
+                        log.supervisor_result = supervisor_result
+                    else:
+                        # Build context for supervisor
+                        context = ""
+                        if current_pending_items:
+                            context = "上一轮未完成项目:\n" + pending_bullets
+
+                        supervisor_result = await self._acheck_completion(
+                            task,
+                            context,
+                            iteration,
+                            log,
+                            deferred_checks,
+                            is_last_iteration=iteration == end_iteration - 1,
+                        )
+
+                    if supervisor_result is None:
+                        every = self.batch_supervisor_every
+                        self._log_status(f"Supervisor检查已延后（每 {every} 轮批量检查一次）")
+                    else:
+                        result_path = self.supervisor.get_result_file_path(iteration)
+                        self._log_status(f"结果已保存到: {result_path}")
+
+                        self._log_status(f"检查结果: {supervisor_result.summary}")
+
+                        # Step 3: Check if complete
+                        if supervisor_result.is_complete:
+                            self._log_status("✅ 任务已完成!")
+                            logs.append(log)
+
+                            if self.on_iteration_complete:
+                                self.on_iteration_complete(log)
+
+                            return TaskRunResult(
+                                success=True,
+                                completed=True,
+                                iterations=iteration,
+                                total_time=time.time() - start_time,
+                                chat_id=chat_id,
+                                logs=logs.to_list(),
+                                final_summary=supervisor_result.summary,
+                            )
+
+                        # Task not complete, update pending items for next iteration
+                        current_pending_items = supervisor_result.pending_items
+                        pending_bullets = WorkerAgent.format_pending_items(current_pending_items)
+
+                        # Incomplete without anything to work on: more iterations won't help
+                        if not current_pending_items:
+                            self._log_status(
+                                "⚠️ Supervisor判定任务未完成，但未给出待完成项目，停止迭代"
+                            )
+                            logs.append(log)
+
+                            if self.on_iteration_complete:
+                                self.on_iteration_complete(log)
+
+                            return TaskRunResult(
+                                success=False,
+                                completed=False,
+                                iterations=iteration,
+                                total_time=time.time() - start_time,
+                                chat_id=chat_id,
+                                logs=logs.to_list(),
+                                final_summary=supervisor_result.summary,
+                                error=(
+                                    "Supervisor reported the task incomplete with no pending items"
+                                ),
+                            )
+
+                        self._log_status(f"待完成项目: {len(current_pending_items)} 项")
+
+                        for i, item in enumerate(current_pending_items, 1):
+                            self._log_status(f"  {i}. {item}")
+
+                except Exception as e:
+                    self._log_status(f"迭代 {iteration} 发生错误: {e}")
+                    log.worker_result = WorkerResult(
+                        success=False,
+                        output="",
+                        error=str(e),
                     )
 
-                supervisor_result = self.supervisor.check_completion(
-                    task, context, on_output=self.on_agent_output, iteration=iteration
-                )
-                log.supervisor_result = supervisor_result
+                # Logs awaiting a batched supervisor check are written once it has run
+                logs.append(log, hold=bool(deferred_checks))
+                self._flush_agent_output()
 
-                self._log_status(f"结果已保存到: {self.supervisor.get_result_file_path(iteration)}")
+                if self.on_iteration_complete:
+                    self.on_iteration_complete(log)
 
-                self._log_status(f"检查结果: {supervisor_result.summary}")
+                # Delay before next iteration: the delay is the minimum spacing between
+                # iteration starts, so only wait for whatever this iteration hasn't used up
+                if iteration < end_iteration - 1:
+                    remaining = self.delay_between_iterations - (time.time() - iteration_start)
+                    if remaining > 0:
+                        self._log_status(f"等待 {remaining:.1f} 秒后继续...")
+                        # Wakes up early if cancel() is called; the loop then stops
+                        await asyncio.to_thread(self._cancel_event.wait, remaining)
 
-                # Step 3: Check if complete
-                if supervisor_result.is_complete:
-                    self._log_status("✅ 任务已完成!")
-                    logs.append(log)
+            # The last iteration may not have reached its check (e.g. the worker raised),
+            # leaving earlier iterations' batched checks queued
+            if deferred_checks:
+                await self._arun_deferred_checks(task, deferred_checks)
 
-                    if self.on_iteration_complete:
-                        self.on_iteration_complete(log)
-
-                    return TaskRunResult(
-                        success=True,
-                        completed=True,
-                        iterations=iteration,
-                        total_time=time.time() - start_time,
-                        chat_id=chat_id,
-                        logs=logs,
-                        final_summary=supervisor_result.summary,
-                    )
+            # Max iterations reached
+            total_iterations = end_iteration - self.start_iteration
+            self._log_status(f"⚠️ 达到最大迭代次数 ({total_iterations})，任务未完成")
 
-                # Task not complete, update pending items for next iteration
-                current_pending_items = supervisor_result.pending_items
-                self._log_status(f"待完成项目: {len(current_pending_items)} 项")
-
-                for i, item in enumerate(current_pending_items, 1):
-                    self._log_status(f"  {i}. {item}")
-
-            except Exception as e:
-                self._log_status(f"迭代 {iteration} 发生错误: {e}")
-                log.worker_result = WorkerResult(
-                    success=False,
-                    output="",
-                    error=str(e),
-                )
-
-            logs.append(log)
-
-            if self.on_iteration_complete:
-                self.on_iteration_complete(log)
-
-            # Delay before next iteration
-            if iteration < end_iteration - 1:
-                self._log_status(f"等待 {self.delay_between_iterations} 秒后继续...")
-                time.sleep(self.delay_between_iterations)
-
-        # Max iterations reached
-        total_iterations = end_iteration - self.start_iteration
-        self._log_status(f"⚠️ 达到最大迭代次数 ({total_iterations})，任务未完成")
-
-        return TaskRunResult(
-            success=False,
-            completed=False,
-            iterations=end_iteration - 1,  # Last iteration number
-            total_time=time.time() - start_time,
-            chat_id=chat_id,
-            logs=logs,
-            final_summary=f"达到最大迭代次数({total_iterations})，任务未完成",
-            error="Max iterations reached without task completion",
-        )
+            return TaskRunResult(
+                success=False,
+                completed=False,
+                iterations=end_iteration - 1,  # Last iteration number
+                total_time=time.time() - start_time,
+                chat_id=chat_id,
+                logs=logs.to_list(),
+                final_summary=f"达到最大迭代次数({total_iterations})，任务未完成",
+                error="Max iterations reached without task completion",
+            )
+        finally:
+            logs.close()
+            self._flush_agent_output()
+            self._close_agents()
 
     def run_check_only(self, task: str) -> SupervisorResult:
         """
@@ -6,20 +6,76 @@ toward task completion.
 """
 
 import json
+import string
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Callable
 
-from agend.agent_cli import AgentCLI, AgentType, AgentResponse
+from agend.agent_cli import AgentCLI, AgentType, AgentResponse, _DATACLASS_SLOTS
 
 
-@dataclass
+def _compile_template(
+    template: str, fields: frozenset[str]
+) -> Optional[list[tuple[str, Optional[str]]]]:
+    """
+    Split a str.format() template into (literal, field name) pairs once.
+
+    Only plain replacement fields from ``fields`` are supported; templates
+    using conversions, format specs, indexing or other names return None so
+    the caller can fall back to str.format().
+    """
+    parts = []
+    try:
+        for literal, name, spec, conversion in string.Formatter().parse(template):
+            if name is not None and (name not in fields or spec or conversion):
+                return None
+            parts.append((literal, name))
+    except ValueError:
+        return None
+    return parts
+
+
+def _bind_template(
+    parts: list[tuple[str, Optional[str]]], values: dict[str, str]
+) -> list[tuple[str, Optional[str]]]:
+    """
+    Partially evaluate a compiled template.
+
+    Fields named in ``values`` are substituted now and merged into the
+    surrounding literals; the remaining fields are kept.
+    """
+    bound: list[tuple[str, Optional[str]]] = []
+    pending_literal = ""
+    for literal, name in parts:
+        pending_literal += literal
+        if name is None:
+            continue
+        if name in values:
+            pending_literal += values[name]
+        else:
+            bound.append((pending_literal, name))
+            pending_literal = ""
+    if pending_literal:
+        bound.append((pending_literal, None))
+    return bound
+
+
+def _render_template(parts: list[tuple[str, Optional[str]]], values: dict[str, str]) -> str:
+    """Render a template compiled by _compile_template()."""
+    return "".join(
+        [literal + values[name] if name is not None else literal for literal, name in parts]
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class WorkerResult:
     """Result from worker agent execution."""
 
     success: bool
     output: str
     error: Optional[str] = None
+    # True if the worker ended its output with WorkerAgent.COMPLETION_MARKER
+    signaled_completion: bool = False
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -27,9 +83,14 @@ class WorkerResult:
             "success": self.success,
             "output": self.output,
             "error": self.error,
+            "signaled_completion": self.signaled_completion,
         }
 
 
+# Replacement fields available to execute prompt templates
+_EXECUTE_PROMPT_FIELDS = frozenset({"task", "pending_section"})
+
+
 class WorkerAgent:
     """
     Worker agent that executes tasks.
@@ -56,6 +117,14 @@ class WorkerAgent:
 {pending_items}
 
 请确保完成上述所有待完成项目。
+"""
+
+    # Line the worker prints last when it considers the whole task done
+    COMPLETION_MARKER = "[TASK_COMPLETE]"
+
+    # Appended to execute prompts when report_completion is enabled
+    COMPLETION_INSTRUCTION = f"""
+如果你确认任务的所有要求都已完成，请在回复的最后单独输出一行 {COMPLETION_MARKER}。
 """
 
     def __init__(
@@ -66,6 +135,7 @@ class WorkerAgent:
         execute_prompt_template: Optional[str] = None,
         on_output: Optional[Callable[[str], None]] = None,
         results_dir: Optional[str] = None,
+        report_completion: bool = False,
     ):
         """
         Initialize the worker agent.
@@ -77,11 +147,19 @@ class WorkerAgent:
             execute_prompt_template: Optional custom prompt template for execution.
             on_output: Optional callback for real-time output streaming.
             results_dir: Optional directory for reading supervisor results. If None, uses ".agend/results".
+            report_completion: Ask the worker to end its output with COMPLETION_MARKER
+                     once the task is done (see WorkerResult.signaled_completion).
         """
         self.agent_cli = agent_cli or AgentCLI.create(agent_type=agent_type, model=model)
         self.execute_prompt_template = execute_prompt_template or self.DEFAULT_EXECUTE_PROMPT
         self.on_output = on_output
         self.results_dir = Path(results_dir) if results_dir else Path(".agend/results")
+        self.report_completion = report_completion
+        # Parsed form of execute_prompt_template, recompiled if the template is reassigned
+        self._compiled_template: Optional[list[tuple[str, Optional[str]]]] = None
+        # The same template with an empty pending section already filled in
+        self._compiled_no_pending: Optional[list[tuple[str, Optional[str]]]] = None
+        self._compiled_for: Optional[str] = None
 
     def get_result_file_path(self, iteration: int) -> Path:
         """Get the file path for a specific iteration's result."""
@@ -130,11 +208,64 @@ class WorkerAgent:
         except (json.JSONDecodeError, IOError):
             return None
 
+    @staticmethod
+    def format_pending_items(pending_items: list[str]) -> str:
+        """Format pending items as a Markdown bullet list ("- item" per line)."""
+        return "\n".join([f"- {item}" for item in pending_items])
+
+    def _build_execute_prompt(
+        self,
+        task: str,
+        pending_items: Optional[list[str]],
+        pending_bullets: Optional[str] = None,
+    ) -> str:
+        """Build the execution prompt for the task and optional pending items."""
+        prompt = self._render_execute_prompt(task, pending_items, pending_bullets)
+        if self.report_completion:
+            prompt += self.COMPLETION_INSTRUCTION
+        return prompt
+
+    def _render_execute_prompt(
+        self,
+        task: str,
+        pending_items: Optional[list[str]],
+        pending_bullets: Optional[str] = None,
+    ) -> str:
+        """Fill execute_prompt_template for the task and optional pending items."""
+        template = self.execute_prompt_template
+        if self._compiled_for is not template:
+            self._compiled_template = _compile_template(template, _EXECUTE_PROMPT_FIELDS)
+            self._compiled_no_pending = (
+                _bind_template(self._compiled_template, {"pending_section": ""})
+                if self._compiled_template is not None
+                else None
+            )
+            self._compiled_for = template
+
+        if not pending_items:
+            # Common case: nothing pending, only the task is left to fill in
+            if self._compiled_no_pending is None:
+                return template.format(task=task, pending_section="")
+            return _render_template(self._compiled_no_pending, {"task": task})
+
+        # Build pending section
+        if pending_bullets is None:
+            pending_bullets = self.format_pending_items(pending_items)
+        pending_section = self.PENDING_SECTION_TEMPLATE.format(pending_items=pending_bullets)
+
+        # Build the full prompt
+        if self._compiled_template is None:
+            return template.format(task=task, pending_section=pending_section)
+        return _render_template(
+            self._compiled_template, {"task": task, "pending_section": pending_section}
+        )
+
     def execute_task(
         self,
         task: str,
         pending_items: Optional[list[str]] = None,
         on_output: Optional[Callable[[str], None]] = None,
+        pending_bullets: Optional[str] = None,
     ) -> WorkerResult:
         """
         Execute the task.
@@ -143,22 +274,13 @@ class WorkerAgent:
             task: The original task description.
             pending_items: Optional list of pending items from supervisor check.
             on_output: Optional callback for real-time output (overrides instance callback).
+            pending_bullets: Optional pending_items already formatted with
+                     format_pending_items(), to avoid formatting them again.
 
         Returns:
             WorkerResult with execution outcome.
         """
-        # Build pending section if there are pending items
-        if pending_items:
-            pending_list = "\n".join(f"- {item}" for item in pending_items)
-            pending_section = self.PENDING_SECTION_TEMPLATE.format(pending_items=pending_list)
-        else:
-            pending_section = ""
-
-        # Build the full prompt
-        prompt = self.execute_prompt_template.format(
-            task=task,
-            pending_section=pending_section,
-        )
+        prompt = self._build_execute_prompt(task, pending_items, pending_bullets)
 
         # Use provided callback or instance callback
         output_callback = on_output or self.on_output
@@ -168,6 +290,29 @@ class WorkerAgent:
 
         return self._process_response(response)
 
+    async def aexecute_task(
+        self,
+        task: str,
+        pending_items: Optional[list[str]] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+        pending_bullets: Optional[str] = None,
+    ) -> WorkerResult:
+        """
+        Asynchronous variant of execute_task().
+
+        Awaits the agent via AgentCLI.aexecute(); arguments and result are
+        the same as for execute_task().
+        """
+        prompt = self._build_execute_prompt(task, pending_items, pending_bullets)
+
+        # Use provided callback or instance callback
+        output_callback = on_output or self.on_output
+
+        # Execute via agent CLI
+        response = await self.agent_cli.aexecute(prompt, on_output=output_callback)
+
+        return self._process_response(response)
+
     def execute_with_context(
         self,
         task: str,
@@ -215,4 +360,9 @@ class WorkerAgent:
             success=response.success,
             output=response.output,
             error=response.error,
+            signaled_completion=(
+                self.report_completion
+                and response.success
+                and response.output.endswith(self.COMPLETION_MARKER)
+            ),
         )
@@ -13,9 +13,20 @@ import os
 import sys
 import subprocess
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from getpass import getpass
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
@@ -25,6 +36,11 @@ def get_project_root() -> Path:
 def get_version() -> str:
     """Extract version from pyproject.toml."""
     pyproject = get_project_root() / "pyproject.toml"
+    if tomllib is not None:
+        with open(pyproject, "rb") as f:
+            return tomllib.load(f)["project"]["version"]
+    
+    # No TOML parser available: scan for the version line
     with open(pyproject, "r") as f:
         for line in f:
             if line.startswith("version"):
@@ -33,16 +49,53 @@ def get_version() -> str:
     raise ValueError("Version not found in pyproject.toml")
 
 
+def run_streaming(cmd: list, cwd: Path) -> tuple:
+    """
+    Run a command, echoing its stdout live.
+
+    Only the last 200 stderr lines are kept (for error reporting), so memory
+    stays constant however much the command prints.
+
+    Returns:
+        Tuple of (return code, list of the last stderr lines).
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1,
+        text=True
+    )
+    
+    def tee_stdout():
+        for line in process.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    
+    stdout_thread = threading.Thread(target=tee_stdout, daemon=True)
+    stdout_thread.start()
+    stderr_tail = deque(process.stderr, maxlen=200)
+    stdout_thread.join()
+    
+    return process.wait(), list(stderr_tail)
+
+
 def clean_build_dirs():
     """Clean up build directories."""
     root = get_project_root()
     dirs_to_clean = ["dist", "build", "agend.egg-info"]
     
-    for dir_name in dirs_to_clean:
-        dir_path = root / dir_name
-        if dir_path.exists():
-            print(f"  Removing {dir_path}")
-            shutil.rmtree(dir_path)
+    # The directories are independent, so remove them concurrently
+    with ThreadPoolExecutor(max_workers=len(dirs_to_clean)) as executor:
+        futures = []
+        for dir_name in dirs_to_clean:
+            dir_path = root / dir_name
+            if dir_path.exists():
+                print(f"  Removing {dir_path}")
+                futures.append(executor.submit(shutil.rmtree, dir_path))
+        for future in futures:
+            future.result()
 
 
 def build_package():
@@ -50,15 +103,10 @@ def build_package():
     root = get_project_root()
     print("\n📦 Building package...")
     
-    result = subprocess.run(
-        [sys.executable, "-m", "build"],
-        cwd=root,
-        capture_output=True,
-        text=True
-    )
+    returncode, stderr_tail = run_streaming([sys.executable, "-m", "build"], cwd=root)
     
-    if result.returncode != 0:
-        print(f"❌ Build failed:\n{result.stderr}")
+    if returncode != 0:
+        print(f"❌ Build failed:\n{''.join(stderr_tail)}")
         sys.exit(1)
     
     print("✓ Build successful")
@@ -82,7 +130,7 @@ def upload_to_pypi(token: str, test: bool = False):
     
     print(f"\n🚀 Uploading to {repo_name}...")
     
-    result = subprocess.run(
+    returncode, stderr_tail = run_streaming(
         [
             sys.executable, "-m", "twine", "upload",
             "--repository-url", repo_url,
@@ -90,13 +138,11 @@ def upload_to_pypi(token: str, test: bool = False):
             "--password", token,
             "dist/*"
         ],
-        cwd=root,
-        capture_output=True,
-        text=True
+        cwd=root
     )
     
-    if result.returncode != 0:
-        print(f"❌ Upload failed:\n{result.stderr}")
+    if returncode != 0:
+        print(f"❌ Upload failed:\n{''.join(stderr_tail)}")
         sys.exit(1)
     
     print(f"✓ Successfully uploaded to {repo_name}")
@@ -104,25 +150,21 @@ def upload_to_pypi(token: str, test: bool = False):
 
 def check_dependencies():
     """Check if required tools are installed."""
-    missing = []
+    def is_installed(module: str) -> bool:
+        try:
+            subprocess.run(
+                [sys.executable, "-m", module, "--version"],
+                capture_output=True, check=True
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+        return True
     
-    # Check build
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "build", "--version"],
-            capture_output=True, check=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        missing.append("build")
-    
-    # Check twine
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "twine", "--version"],
-            capture_output=True, check=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        missing.append("twine")
+    # Check build and twine concurrently
+    modules = ["build", "twine"]
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        installed = list(executor.map(is_installed, modules))
+    missing = [module for module, ok in zip(modules, installed) if not ok]
     
     if missing:
         print(f"❌ Missing dependencies: {', '.join(missing)}")